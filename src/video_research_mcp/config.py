@@ -10,6 +10,10 @@ from pydantic import BaseModel, Field, field_validator
 
 VALID_THINKING_LEVELS = {"minimal", "low", "medium", "high"}
 
+# Max parallel per-item Gemini calls in video_batch_analyze,
+# content_batch_analyze (individual mode), and research_document phases 1-2
+BATCH_CONCURRENCY = 3
+
 MODEL_PRESETS: dict[str, dict[str, str]] = {
     "best": {
         "default_model": "gemini-3.1-pro-preview",
@@ -113,6 +117,7 @@ class ServerConfig(BaseModel):
     reranker_enabled: bool = Field(default=False)
     reranker_provider: str = Field(default="cohere")
     flash_summarize: bool = Field(default=True)
+    weaviate_max_concurrency: int = Field(default=8)
     context_cache_ttl_seconds: int = Field(default=3600)
     clear_cache_on_shutdown: bool = Field(default=False)
     tracing_enabled: bool = Field(default=False)
@@ -129,7 +134,7 @@ class ServerConfig(BaseModel):
             raise ValueError(f"Invalid thinking level '{value}'. Allowed: {allowed}")
         return level
 
-    @field_validator("cache_ttl_days", "max_sessions", "session_timeout_hours", "session_max_turns", "context_cache_ttl_seconds")
+    @field_validator("cache_ttl_days", "max_sessions", "session_timeout_hours", "session_max_turns", "context_cache_ttl_seconds", "weaviate_max_concurrency")
     @classmethod
     def validate_positive_ints(cls, value: int) -> int:
         if value < 1:
@@ -184,6 +189,7 @@ class ServerConfig(BaseModel):
             ),
             reranker_provider=os.getenv("RERANKER_PROVIDER", "cohere"),
             flash_summarize=os.getenv("FLASH_SUMMARIZE", "true").lower() != "false",
+            weaviate_max_concurrency=int(os.getenv("WEAVIATE_MAX_CONCURRENCY", "8")),
             context_cache_ttl_seconds=int(os.getenv("GEMINI_CONTEXT_CACHE_TTL", "3600")),
             clear_cache_on_shutdown=os.getenv("CLEAR_CACHE_ON_SHUTDOWN", "").lower() in ("1", "true", "yes"),
             tracing_enabled=_resolve_tracing_enabled(
@@ -167,7 +167,7 @@ def diagnostics() -> dict:
     return {
         "registry": {f"{cid}/{model}": name for (cid, model), name in _registry.items()},
         "suppressed": [f"{cid}/{model}" for cid, model in _suppressed],
-        "pending": [f"{cid}/{model}" for cid, model in _pending if not _pending[(cid, model)].done()],
+        "pending": [f"{cid}/{model}" for (cid, model), task in _pending.items() if not task.done()],
         "recent_failures": {f"{cid}/{model}": reason for (cid, model), reason in _last_failure.items()},
     }
 
@@ -0,0 +1,64 @@
+"""In-memory cache of recent knowledge_search results.
+
+Shared by the knowledge tools (which read and fill it) and the
+write-through store (which invalidates it), so it imports neither.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+
+from .models.knowledge import KnowledgeSearchResult
+
+_RESULT_TTL = 30.0  # seconds a repeated identical search is served from memory
+_RESULT_CACHE_MAX = 128
+
+# search params -> (result, monotonic expiry); ordered oldest-used first for LRU eviction
+_result_cache: OrderedDict[tuple, tuple[KnowledgeSearchResult, float]] = OrderedDict()
+
+# Bumped by every invalidation; a search that started under an older
+# generation may have missed a write, so its result is not cached
+_generation = 0
+
+
+def search_generation() -> int:
+    """Return the current cache generation, to capture before querying."""
+    return _generation
+
+
+def cached_search_result(key: tuple) -> KnowledgeSearchResult | None:
+    """Return an unexpired cached search result for *key*, marking it recently used."""
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    if entry[1] <= time.monotonic():
+        _result_cache.pop(key, None)
+        return None
+    _result_cache.move_to_end(key)
+    return entry[0]
+
+
+def store_search_result(key: tuple, result: KnowledgeSearchResult, generation: int) -> None:
+    """Cache *result* for _RESULT_TTL seconds, evicting the least recently used.
+
+    Dropped when the cache was invalidated after *generation* was captured,
+    since the result may predate a write that landed mid-search.
+    """
+    if generation != _generation:
+        return
+    _result_cache[key] = (result, time.monotonic() + _RESULT_TTL)
+    _result_cache.move_to_end(key)
+    while len(_result_cache) > _RESULT_CACHE_MAX:
+        _result_cache.popitem(last=False)
+
+
+def invalidate_search_results() -> None:
+    """Forget cached search results after a Weaviate write.
+
+    Called by knowledge_ingest and every weaviate_store writer. Searches
+    started before the write finish normally but do not cache their result.
+    """
+    global _generation
+    _generation += 1
+    _result_cache.clear()
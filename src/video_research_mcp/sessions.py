@@ -11,9 +11,12 @@ from google.genai import types
 from .config import get_config
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoSession:
-    """Persistent conversation context for a single video."""
+    """Persistent conversation context for a single video.
+
+    Slotted: one instance per live session, and only declared fields are set.
+    """
 
     session_id: str
     url: str
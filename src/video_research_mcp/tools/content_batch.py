@@ -11,6 +11,7 @@ from google.genai import types
 from mcp.types import ToolAnnotations
 from pydantic import Field
 
+from ..config import BATCH_CONCURRENCY
 from ..errors import make_tool_error
 from ..models.content_batch import BatchContentItem, BatchContentResult
 from ..tracing import trace
@@ -139,7 +140,7 @@ async def _individual_files(
     """
     from ..models.content import ContentResult
 
-    semaphore = asyncio.Semaphore(3)
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
     schema = output_schema or ContentResult.model_json_schema()
 
     async def _process(path: Path) -> BatchContentItem:
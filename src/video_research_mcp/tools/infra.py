@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -16,6 +18,39 @@ from ..types import CacheAction, ModelPreset, ThinkingLevel
 
 infra_server = FastMCP("infra")
 
+# Presets are static, so the name -> label mapping is built once at import;
+# read-only so callers can only ever receive copies of it
+_AVAILABLE_PRESETS: Mapping[str, str] = MappingProxyType(
+    {k: v["label"] for k, v in MODEL_PRESETS.items()}
+)
+_SECRET_FIELDS = frozenset({"gemini_api_key", "youtube_api_key", "weaviate_api_key"})
+
+
+def _cache_stats(content_id: str | None) -> dict:
+    return cache_mod.stats()
+
+
+def _cache_list(content_id: str | None) -> dict:
+    return {"entries": cache_mod.list_entries()}
+
+
+def _cache_clear(content_id: str | None) -> dict:
+    return {"removed": cache_mod.clear(content_id)}
+
+
+def _cache_context(content_id: str | None) -> dict:
+    from .. import context_cache
+    return context_cache.diagnostics()
+
+
+# action -> handler; every handler takes the optional content_id scope.
+_CACHE_ACTIONS: dict[str, Callable[[str | None], dict]] = {
+    "stats": _cache_stats,
+    "list": _cache_list,
+    "clear": _cache_clear,
+    "context": _cache_context,
+}
+
 
 @infra_server.tool(
     annotations=ToolAnnotations(
@@ -40,17 +75,10 @@ async def infra_cache(
         Dict with operation-specific results (file_count, entries, removed count,
         or context cache diagnostics).
     """
-    if action == "stats":
-        return cache_mod.stats()
-    if action == "list":
-        return {"entries": cache_mod.list_entries()}
-    if action == "clear":
-        removed = cache_mod.clear(content_id)
-        return {"removed": removed}
-    if action == "context":
-        from .. import context_cache
-        return context_cache.diagnostics()
-    return {"error": f"Unknown action: {action}", "valid_actions": ["stats", "list", "clear", "context"]}
+    handler = _CACHE_ACTIONS.get(action)
+    if handler is None:
+        return {"error": f"Unknown action: {action}", "valid_actions": list(_CACHE_ACTIONS)}
+    return handler(content_id)
 
 
 @infra_server.tool(
@@ -112,9 +140,9 @@ async def infra_configure(
                 break
 
         return {
-            "current_config": cfg.model_dump(exclude={"gemini_api_key"}),
+            "current_config": cfg.model_dump(exclude=_SECRET_FIELDS),
             "active_preset": active,
-            "available_presets": {k: v["label"] for k, v in MODEL_PRESETS.items()},
+            "available_presets": dict(_AVAILABLE_PRESETS),
         }
     except Exception as exc:
         return make_tool_error(exc)
@@ -48,6 +48,11 @@ _MISSING_DEP_ERROR = (
 )
 
 
+def _reset_query_agent_cache() -> None:
+    """Drop all cached QueryAgents (testing utility, like WeaviateClient.reset)."""
+    _query_agents.clear()
+
+
 async def _get_query_agent(collections: list[str] | None = None) -> AsyncQueryAgent:
     """Return a cached AsyncQueryAgent, invalidating on client reconnect."""
     target = tuple(sorted(collections)) if collections else tuple(ALL_COLLECTION_NAMES)
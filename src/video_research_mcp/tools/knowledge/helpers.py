@@ -2,20 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Literal
+from collections.abc import Callable
+from typing import Literal, TypeVar
 
+from ...config import get_config
 from ...weaviate_schema import ALL_COLLECTIONS as SCHEMA_COLLECTIONS
 
 SearchType = Literal["hybrid", "semantic", "keyword"]
 
+T = TypeVar("T")
+
 logger = logging.getLogger(__name__)
 
 ALL_COLLECTION_NAMES: list[str] = [c.name for c in SCHEMA_COLLECTIONS]
 
 # Pre-compute allowed property names per collection for ingest validation
-ALLOWED_PROPERTIES: dict[str, set[str]] = {
-    c.name: {p.name for p in c.properties} for c in SCHEMA_COLLECTIONS
+# and collection-aware filters; frozen so callers cannot mutate the schema view
+ALLOWED_PROPERTIES: dict[str, frozenset[str]] = {
+    c.name: frozenset(p.name for p in c.properties) for c in SCHEMA_COLLECTIONS
 }
 
 
@@ -35,6 +41,36 @@ RERANK_PROPERTY: dict[str, str] = {
 }
 
 
+# Process-wide cap on concurrent Weaviate queries from knowledge fan-out,
+# sized from WEAVIATE_MAX_CONCURRENCY on first use
+_query_slots: asyncio.Semaphore | None = None
+
+
+def _get_query_slots() -> asyncio.Semaphore:
+    """Return (or create) the shared query semaphore."""
+    global _query_slots
+    if _query_slots is None:
+        _query_slots = asyncio.Semaphore(get_config().weaviate_max_concurrency)
+    return _query_slots
+
+
+async def bounded_query(fn: Callable[..., T], *args: object) -> T:
+    """Run a blocking Weaviate call in a worker thread once a query slot is free.
+
+    The slot is acquired on the event loop before dispatching, so queries
+    waiting for one stay suspended coroutines instead of parked worker
+    threads, and at most ``WEAVIATE_MAX_CONCURRENCY`` run at once.
+    """
+    async with _get_query_slots():
+        return await asyncio.to_thread(fn, *args)
+
+
+def _reset_query_slots() -> None:
+    """Drop the shared semaphore (testing utility, matches WeaviateClient.reset)."""
+    global _query_slots
+    _query_slots = None
+
+
 def weaviate_not_configured() -> dict:
     """Return an empty result when Weaviate is not configured."""
     return {"error": "Weaviate not configured", "hint": "Set WEAVIATE_URL to enable knowledge tools"}
@@ -11,6 +11,7 @@ from pydantic import Field
 from ...config import get_config
 from ...errors import make_tool_error
 from ...models.knowledge import KnowledgeIngestResult
+from ...search_cache import invalidate_search_results
 from ...types import KnowledgeCollection, coerce_json_param
 from ...weaviate_client import WeaviateClient
 from . import knowledge_server
@@ -49,7 +50,7 @@ async def knowledge_ingest(
     properties = coerce_json_param(properties, dict)
 
     # Validate properties against schema
-    allowed = ALLOWED_PROPERTIES.get(collection, set())
+    allowed = ALLOWED_PROPERTIES.get(collection, frozenset())
     unknown = set(properties) - allowed
     if unknown:
         return make_tool_error(
@@ -64,6 +65,7 @@ async def knowledge_ingest(
             return str(uuid)
 
         object_id = await asyncio.to_thread(_insert)
+        invalidate_search_results()
         return KnowledgeIngestResult(
             collection=collection,
             object_id=object_id,
@@ -21,9 +21,22 @@ from ...models.knowledge import (
 from ...types import KnowledgeCollection
 from ...weaviate_client import WeaviateClient
 from . import knowledge_server
-from .helpers import ALL_COLLECTION_NAMES, ALLOWED_PROPERTIES, logger, serialize, weaviate_not_configured
+from .helpers import (
+    ALL_COLLECTION_NAMES,
+    ALLOWED_PROPERTIES,
+    bounded_query,
+    logger,
+    serialize,
+    weaviate_not_configured,
+)
 from ...tracing import trace
 
+# Disabled-mode payloads, dumped once; callers get fresh copies
+_DISABLED_RELATED = KnowledgeRelatedResult(
+    source_id="", source_collection="",
+).model_dump(mode="json")
+_DISABLED_STATS = KnowledgeStatsResult().model_dump(mode="json")
+
 
 @knowledge_server.tool(
     annotations=ToolAnnotations(
@@ -50,9 +63,10 @@ async def knowledge_related(
         Dict matching KnowledgeRelatedResult schema.
     """
     if not get_config().weaviate_enabled:
-        return KnowledgeRelatedResult(
-            source_id=object_id, source_collection=collection,
-        ).model_dump(mode="json")
+        return {
+            **_DISABLED_RELATED, "source_id": object_id, "source_collection": collection,
+            "related": [],
+        }
 
     try:
         def _search():
@@ -118,32 +132,34 @@ async def knowledge_stats(
         Dict matching KnowledgeStatsResult schema.
     """
     if not get_config().weaviate_enabled:
-        return KnowledgeStatsResult().model_dump(mode="json")
+        return {**_DISABLED_STATS, "collections": []}
 
     try:
         target = [collection] if collection else ALL_COLLECTION_NAMES
 
-        def _count():
+        def _count_one(col_name: str) -> CollectionStats:
+            """Count one collection; per-collection failures report zero."""
             client = WeaviateClient.get()
-            stats = []
-            for col_name in target:
-                try:
-                    col = client.collections.get(col_name)
-                    agg = col.aggregate.over_all(total_count=True)
-                    groups = None
-                    if group_by and group_by in ALLOWED_PROPERTIES.get(col_name, set()):
-                        groups = _aggregate_groups(col, group_by)
-                    stats.append(CollectionStats(
-                        name=col_name,
-                        count=agg.total_count or 0,
-                        groups=groups,
-                    ))
-                except Exception as exc:
-                    logger.warning("Stats failed for %s: %s", col_name, exc)
-                    stats.append(CollectionStats(name=col_name, count=0))
-            return stats
-
-        stats = await asyncio.to_thread(_count)
+            try:
+                col = client.collections.get(col_name)
+                # Total count first, then (optionally) the grouped aggregate
+                agg = col.aggregate.over_all(total_count=True)
+                groups = None
+                if group_by and group_by in ALLOWED_PROPERTIES.get(col_name, frozenset()):
+                    groups = _aggregate_groups(col, group_by)
+                return CollectionStats(
+                    name=col_name,
+                    count=agg.total_count or 0,
+                    groups=groups,
+                )
+            except Exception as exc:
+                logger.warning("Stats failed for %s: %s", col_name, exc)
+                return CollectionStats(name=col_name, count=0)
+
+        # Collections are independent round-trips — aggregate them concurrently
+        stats = list(await asyncio.gather(
+            *(bounded_query(_count_one, col_name) for col_name in target)
+        ))
         total = sum(s.count for s in stats)
         return KnowledgeStatsResult(
             collections=stats,
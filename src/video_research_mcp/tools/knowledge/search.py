@@ -3,22 +3,36 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 from typing import Annotated
 
 from mcp.types import ToolAnnotations
 from pydantic import Field
-from weaviate.classes.query import MetadataQuery
+from weaviate.classes.query import HybridFusion, MetadataQuery
 
 from ...config import get_config
 from ...errors import make_tool_error
 from ...models.knowledge import KnowledgeHit, KnowledgeSearchResult
+from ...search_cache import cached_search_result, search_generation, store_search_result
 from ...types import KnowledgeCollection, coerce_json_param
 from ...weaviate_client import WeaviateClient
 from ..knowledge_filters import build_collection_filter
 from . import knowledge_server
-from .helpers import ALL_COLLECTION_NAMES, ALLOWED_PROPERTIES, RERANK_PROPERTY, SearchType, logger, serialize
+from .helpers import (
+    ALL_COLLECTION_NAMES,
+    ALLOWED_PROPERTIES,
+    RERANK_PROPERTY,
+    SearchType,
+    bounded_query,
+    logger,
+    serialize,
+)
+from .summarize import summarize_hits
 from ...tracing import trace
 
+# Disabled-mode payload, dumped once; callers get a fresh copy with their query
+_DISABLED_RESULT = KnowledgeSearchResult(query="").model_dump(mode="json")
+
 
 @knowledge_server.tool(
     annotations=ToolAnnotations(
@@ -71,7 +85,7 @@ async def knowledge_search(
         Dict matching KnowledgeSearchResult schema.
     """
     if not get_config().weaviate_enabled:
-        return KnowledgeSearchResult(query=query).model_dump(mode="json")
+        return {**_DISABLED_RESULT, "query": query, "results": []}
 
     collections = coerce_json_param(collections, list)
 
@@ -84,65 +98,86 @@ async def knowledge_search(
             category=category, video_id=video_id,
         )
         filters_applied = {k: v for k, v in filter_kwargs.items() if v is not None} or None
-        reranked = False
 
-        def _search():
+        cache_key = (
+            query, tuple(target), search_type, limit, alpha, tuple(filter_kwargs.values()),
+            cfg.reranker_enabled, cfg.flash_summarize, cfg.flash_model,
+        )
+        cached = cached_search_result(cache_key)
+        if cached is not None:
+            return cached.model_dump(mode="json")
+        # Captured before querying so a write landing mid-search voids the store below
+        generation = search_generation()
+
+        failed: list[str] = []
+
+        def _search_one(col_name: str) -> tuple[list[KnowledgeHit], bool]:
+            """Query one collection; per-collection failures yield no hits."""
             client = WeaviateClient.get()
-            hits: list[KnowledgeHit] = []
-            any_reranked = False
-            for col_name in target:
-                try:
-                    collection = client.collections.get(col_name)
-                    col_filter = build_collection_filter(
-                        col_name, ALLOWED_PROPERTIES.get(col_name, set()), **filter_kwargs,
-                    )
-                    rerank_prop = RERANK_PROPERTY.get(col_name) if cfg.reranker_enabled else None
-                    rerank_cfg = _build_rerank(rerank_prop, query) if rerank_prop else None
-                    fetch_limit = limit * _OVERFETCH_FACTOR if rerank_cfg else limit
-
-                    response = _dispatch_search(
-                        collection, query, search_type, fetch_limit, alpha, col_filter, rerank_cfg,
-                    )
-                    if rerank_cfg:
-                        any_reranked = True
-                    for obj in response.objects:
-                        props = {k: serialize(v) for k, v in obj.properties.items()}
-                        base_score, rerank_score = _extract_score(obj, search_type)
-                        hits.append(KnowledgeHit(
-                            collection=col_name,
-                            object_id=str(obj.uuid),
-                            score=base_score,
-                            rerank_score=rerank_score,
-                            properties=props,
-                        ))
-                except Exception as exc:
-                    logger.warning("Search failed for %s: %s", col_name, exc)
-
-            # Sort by rerank_score when available, fall back to base score
-            hits.sort(
-                key=lambda h: (h.rerank_score if h.rerank_score is not None else -1, h.score),
-                reverse=True,
-            )
-            return hits, any_reranked
-
-        hits, reranked = await asyncio.to_thread(_search)
-        hits = hits[:limit]
+            try:
+                collection = client.collections.get(col_name)
+                col_filter = build_collection_filter(
+                    col_name, ALLOWED_PROPERTIES.get(col_name, frozenset()), **filter_kwargs,
+                )
+                rerank_prop = RERANK_PROPERTY.get(col_name) if cfg.reranker_enabled else None
+                rerank_cfg = _build_rerank(rerank_prop, query) if rerank_prop else None
+                fetch_limit = limit * _OVERFETCH_FACTOR if rerank_cfg else limit
+
+                response = _dispatch_search(
+                    collection, query, search_type, fetch_limit, alpha, col_filter, rerank_cfg,
+                )
+                hits: list[KnowledgeHit] = []
+                for obj in response.objects:
+                    props = {k: serialize(v) for k, v in obj.properties.items()}
+                    base_score, rerank_score = _extract_score(obj, search_type)
+                    hits.append(KnowledgeHit(
+                        collection=col_name,
+                        object_id=str(obj.uuid),
+                        score=base_score,
+                        rerank_score=rerank_score,
+                        properties=props,
+                    ))
+                return hits, rerank_cfg is not None
+            except Exception as exc:
+                logger.warning("Search failed for %s: %s", col_name, exc)
+                failed.append(col_name)
+                return [], False
+
+        # Collections are independent round-trips — query them concurrently
+        per_collection = await asyncio.gather(
+            *(bounded_query(_search_one, col_name) for col_name in target)
+        )
+        reranked = any(col_reranked for _, col_reranked in per_collection)
+
+        # Top-k by rerank_score when available, fall back to base score;
+        # same order as a stable descending sort truncated to limit
+        hits = heapq.nlargest(
+            limit,
+            (hit for col_hits, _ in per_collection for hit in col_hits),
+            key=_rank_key,
+        )
 
         # Flash post-processing (async, best-effort)
         flash_processed = False
         if cfg.flash_summarize and hits:
-            from .summarize import summarize_hits
             hits = await summarize_hits(hits, query)
             flash_processed = any(h.summary is not None for h in hits)
 
-        return KnowledgeSearchResult(
+        # Every field is built here from already-validated KnowledgeHits,
+        # so skip re-validating the wrapper before it is dumped
+        result = KnowledgeSearchResult.model_construct(
             query=query,
             total_results=len(hits),
             results=hits,
             filters_applied=filters_applied,
             reranked=reranked,
             flash_processed=flash_processed,
-        ).model_dump(mode="json")
+        )
+        # Only cache complete answers — not partial ones from a failed
+        # collection or a Flash pass that silently fell back to raw hits
+        if not failed and flash_processed == (cfg.flash_summarize and bool(hits)):
+            store_search_result(cache_key, result, generation)
+        return result.model_dump(mode="json")
 
     except Exception as exc:
         return make_tool_error(exc)
@@ -151,6 +186,11 @@ async def knowledge_search(
 _OVERFETCH_FACTOR = 3
 
 
+def _rank_key(hit: KnowledgeHit) -> tuple[float, float]:
+    """Ranking key: rerank score first (missing ranks lowest), then base score."""
+    return (hit.rerank_score if hit.rerank_score is not None else -1, hit.score)
+
+
 def _build_rerank(prop: str, query: str):
     """Build a Rerank config for Weaviate query methods."""
     from weaviate.classes.query import Rerank
@@ -175,11 +215,13 @@ def _dispatch_search(collection, query, search_type, limit, alpha, col_filter, r
             rerank=rerank_cfg,
             return_metadata=MetadataQuery(score=True),
         )
-    # Default: hybrid
+    # Default: hybrid. Relative-score fusion keeps scores in [0, 1] per
+    # collection, so hits from different collections merge on a common scale.
     return collection.query.hybrid(
         query=query,
         limit=limit,
         alpha=alpha,
+        fusion_type=HybridFusion.RELATIVE_SCORE,
         filters=col_filter,
         rerank=rerank_cfg,
         return_metadata=MetadataQuery(score=True),
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 
+from ...client import GeminiClient
 from ...config import get_config
 from ...models.knowledge import HitSummary, HitSummaryBatch, KnowledgeHit
 
@@ -62,7 +63,9 @@ async def summarize_hits(
 ) -> list[KnowledgeHit]:
     """Score relevance and trim properties via Gemini Flash.
 
-    Best-effort: returns raw hits on any error. Caps batch at 20 hits.
+    Best-effort: returns raw hits on any error. All hits are scored in a
+    single Flash call; only the first ``_MAX_BATCH`` (100) appear in the
+    prompt, and hits beyond that pass through unsummarized.
 
     Args:
         hits: Search results to process.
@@ -75,8 +78,6 @@ async def summarize_hits(
         return hits
 
     try:
-        from ...client import GeminiClient
-
         cfg = get_config()
         prompt = _build_prompt(hits, query)
         batch = await GeminiClient.generate_structured(
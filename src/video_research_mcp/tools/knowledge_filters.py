@@ -7,6 +7,7 @@ collection (checked against _ALLOWED_PROPERTIES from the schema).
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
 from datetime import datetime, timezone
 
 from weaviate.classes.query import Filter
@@ -14,7 +15,7 @@ from weaviate.classes.query import Filter
 
 def build_collection_filter(
     col_name: str,
-    allowed_properties: set[str],
+    allowed_properties: AbstractSet[str],
     *,
     evidence_tier: str | None = None,
     source_tool: str | None = None,
@@ -12,6 +12,7 @@ from mcp.types import ToolAnnotations
 from pydantic import Field
 
 from ..client import GeminiClient
+from ..config import BATCH_CONCURRENCY
 from ..errors import make_tool_error
 from ..tracing import trace
 from ..models.research_document import (
@@ -129,15 +130,17 @@ async def _phase_document_map(
 ) -> list[DocumentMap]:
     """Phase 1: Extract structure overview from each document."""
     prompt = DOCUMENT_MAP.format(instruction=instruction)
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
 
     async def _map_one(part: types.Part, source: DocumentSource) -> DocumentMap:
         contents = types.Content(parts=[part, types.Part(text=prompt)])
-        result = await GeminiClient.generate_structured(
-            contents,
-            schema=DocumentMap,
-            system_instruction=DOCUMENT_RESEARCH_SYSTEM,
-            thinking_level=thinking_level,
-        )
+        async with semaphore:
+            result = await GeminiClient.generate_structured(
+                contents,
+                schema=DocumentMap,
+                system_instruction=DOCUMENT_RESEARCH_SYSTEM,
+                thinking_level=thinking_level,
+            )
         result.source_filename = source.filename
         return result
 
@@ -153,6 +156,7 @@ async def _phase_evidence_extraction(
     thinking_level: ThinkingLevel,
 ) -> list[DocumentFindingsContainer]:
     """Phase 2: Extract evidence-tiered findings from each document."""
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
 
     async def _extract_one(
         part: types.Part, source: DocumentSource, doc_map: DocumentMap,
@@ -160,12 +164,13 @@ async def _phase_evidence_extraction(
         map_text = json.dumps(doc_map.model_dump(mode="json"), indent=2)
         prompt = DOCUMENT_EVIDENCE.format(instruction=instruction, document_map=map_text)
         contents = types.Content(parts=[part, types.Part(text=prompt)])
-        result = await GeminiClient.generate_structured(
-            contents,
-            schema=DocumentFindingsContainer,
-            system_instruction=DOCUMENT_RESEARCH_SYSTEM,
-            thinking_level=thinking_level,
-        )
+        async with semaphore:
+            result = await GeminiClient.generate_structured(
+                contents,
+                schema=DocumentFindingsContainer,
+                system_instruction=DOCUMENT_RESEARCH_SYSTEM,
+                thinking_level=thinking_level,
+            )
         result.document = source.filename
         return result
 
@@ -8,8 +8,10 @@ import re
 import tempfile
 from pathlib import Path
 
+import httpx
+
 from ..config import get_config
-from ..url_policy import download_checked
+from ..url_policy import download_checked, download_client
 
 from .video_file import _file_content_hash, _upload_large_file
 
@@ -36,8 +38,8 @@ def _doc_mime_type(path: Path) -> str:
     return mime
 
 
-_ARXIV_ABS_RE = re.compile(r"https?://arxiv\.org/abs/([\d.]+)(v\d+)?/?(?:\?.*)?$")
-_ARXIV_PDF_RE = re.compile(r"https?://arxiv\.org/pdf/([\d.]+)(v\d+)?/?(?:\?.*)?$")
+# abs/ and extension-less pdf/ pages both map to the canonical .pdf URL
+_ARXIV_RE = re.compile(r"https?://arxiv\.org/(?:abs|pdf)/([\d.]+)(v\d+)?/?(?:\?.*)?$")
 
 
 def _normalize_document_url(url: str) -> str:
@@ -47,15 +49,11 @@ def _normalize_document_url(url: str) -> str:
         - arxiv.org/abs/XXXX.XXXXX -> arxiv.org/pdf/XXXX.XXXXX.pdf
         - arxiv.org/pdf/XXXX.XXXXX -> arxiv.org/pdf/XXXX.XXXXX.pdf (ensure .pdf extension)
     """
-    # arXiv abstract page -> PDF
-    m = _ARXIV_ABS_RE.match(url)
-    if m:
-        paper_id = m.group(1)
-        version = m.group(2) or ""
-        return f"https://arxiv.org/pdf/{paper_id}{version}.pdf"
+    # Most URLs are not arXiv; skip the regex for them
+    if "arxiv.org/" not in url:
+        return url
 
-    # arXiv PDF without .pdf extension
-    m = _ARXIV_PDF_RE.match(url)
+    m = _ARXIV_RE.match(url)
     if m:
         paper_id = m.group(1)
         version = m.group(2) or ""
@@ -80,11 +78,11 @@ async def _prepare_document(path: Path) -> tuple[str, str]:
     return uri, content_id
 
 
-async def _download_document(url: str, tmp_dir: Path) -> Path:
+async def _download_document(url: str, tmp_dir: Path, client: httpx.AsyncClient | None = None) -> Path:
     """Download a URL to a temp file with SSRF protection."""
     url = _normalize_document_url(url)
     cfg = get_config()
-    return await download_checked(url, tmp_dir, max_bytes=cfg.doc_max_download_bytes)
+    return await download_checked(url, tmp_dir, max_bytes=cfg.doc_max_download_bytes, client=client)
 
 
 async def _prepare_all_documents(
@@ -104,8 +102,10 @@ async def _prepare_all_documents(
     downloaded: list[tuple[Path, str]] = []
     if urls:
         tmp_dir = Path(tempfile.mkdtemp(prefix="research_doc_"))
-        download_tasks = [_download_document(u, tmp_dir) for u in urls]
-        results = await asyncio.gather(*download_tasks, return_exceptions=True)
+        # One client for the batch so documents on the same host share connections
+        async with download_client() as client:
+            download_tasks = [_download_document(u, tmp_dir, client) for u in urls]
+            results = await asyncio.gather(*download_tasks, return_exceptions=True)
         for url, result in zip(urls, results):
             if isinstance(result, Exception):
                 logger.warning("Failed to download %s (%s): %s", url, type(result).__name__, result)
@@ -9,6 +9,7 @@ from typing import Annotated
 from mcp.types import ToolAnnotations
 from pydantic import Field
 
+from ..config import BATCH_CONCURRENCY
 from ..errors import make_tool_error
 from ..models.video_batch import BatchVideoItem, BatchVideoResult
 from ..types import ThinkingLevel, VideoDirectoryPath, coerce_json_param
@@ -78,7 +79,7 @@ async def video_batch_analyze(
             failed=0,
         ).model_dump(mode="json")
 
-    semaphore = asyncio.Semaphore(3)
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
 
     async def _process(fp: Path) -> BatchVideoItem:
         async with semaphore:
@@ -7,6 +7,9 @@ from typing import Annotated, Literal
 
 from pydantic import Field
 
+# Opening character a JSON document of each container type must start with
+_JSON_OPENERS: dict[type, str] = {dict: "{", list: "["}
+
 
 def coerce_json_param(value: str | dict | list | None, expected_type: type) -> dict | list | None:
     """Parse MCP JSON-RPC string params back to dict/list.
@@ -23,6 +26,10 @@ def coerce_json_param(value: str | dict | list | None, expected_type: type) -> d
     """
     if not isinstance(value, str):
         return value
+    # Skip the decoder (and its exception) for strings that cannot be the expected container
+    opener = _JSON_OPENERS.get(expected_type)
+    if opener is not None and not value.lstrip().startswith(opener):
+        return value
     try:
         parsed = json.loads(value)
         if isinstance(parsed, expected_type):
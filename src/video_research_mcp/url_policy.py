@@ -115,7 +115,22 @@ def _verify_peer_ip(response: httpx.Response) -> None:
         )
 
 
-async def download_checked(url: str, tmp_dir: Path, *, max_bytes: int) -> Path:
+def download_client() -> httpx.AsyncClient:
+    """Create the redirect-limited HTTP client used for checked downloads.
+
+    Callers fetching several URLs in one operation can open a single client
+    and pass it to each download_checked call so connections are pooled.
+    """
+    return httpx.AsyncClient(follow_redirects=True, max_redirects=5, timeout=60)
+
+
+async def download_checked(
+    url: str,
+    tmp_dir: Path,
+    *,
+    max_bytes: int,
+    client: httpx.AsyncClient | None = None,
+) -> Path:
     """Download a URL with SSRF protection and size limits.
 
     Uses async DNS pre-validation and post-connect peer IP verification
@@ -125,6 +140,8 @@ async def download_checked(url: str, tmp_dir: Path, *, max_bytes: int) -> Path:
         url: HTTPS URL to download.
         tmp_dir: Directory to write the downloaded file into.
         max_bytes: Maximum response body size in bytes.
+        client: Shared client from download_client(); the caller owns and
+            closes it. When omitted, a client is created for this download.
 
     Returns:
         Path to the downloaded file.
@@ -140,23 +157,32 @@ async def download_checked(url: str, tmp_dir: Path, *, max_bytes: int) -> Path:
     filename = url_path if "." in url_path else "document.pdf"
     local = tmp_dir / filename
 
-    async with httpx.AsyncClient(follow_redirects=True, max_redirects=5, timeout=60) as client:
-        async with client.stream("GET", url) as resp:
-            _verify_peer_ip(resp)
-            # Validate final URL after redirects (blocks scheme downgrade / private hosts)
-            final_url = str(resp.url)
-            if final_url != url:
-                await validate_url(final_url)
-            resp.raise_for_status()
-            accumulated = 0
-            with local.open("wb") as f:
-                async for chunk in resp.aiter_bytes():
-                    accumulated += len(chunk)
-                    if accumulated > max_bytes:
-                        raise UrlPolicyError(
-                            f"Response exceeds size limit ({max_bytes} bytes)"
-                        )
-                    f.write(chunk)
+    if client is None:
+        async with download_client() as own_client:
+            accumulated = await _stream_to_file(own_client, url, local, max_bytes)
+    else:
+        accumulated = await _stream_to_file(client, url, local, max_bytes)
 
     logger.info("Downloaded %s (%d bytes) to %s", url, accumulated, local)
     return local
+
+
+async def _stream_to_file(client: httpx.AsyncClient, url: str, local: Path, max_bytes: int) -> int:
+    """Stream one response body to disk, enforcing the peer and size checks."""
+    async with client.stream("GET", url) as resp:
+        _verify_peer_ip(resp)
+        # Validate final URL after redirects (blocks scheme downgrade / private hosts)
+        final_url = str(resp.url)
+        if final_url != url:
+            await validate_url(final_url)
+        resp.raise_for_status()
+        accumulated = 0
+        with local.open("wb") as f:
+            async for chunk in resp.aiter_bytes():
+                accumulated += len(chunk)
+                if accumulated > max_bytes:
+                    raise UrlPolicyError(
+                        f"Response exceeds size limit ({max_bytes} bytes)"
+                    )
+                f.write(chunk)
+    return accumulated
@@ -165,6 +165,11 @@ class WeaviateClient:
         if not cfg.weaviate_url:
             raise ValueError("WEAVIATE_URL not configured")
 
+        # Fast path: fan-out callers hit this concurrently once connected
+        client = _client
+        if client is not None and _schema_ensured:
+            return client
+
         with _lock:
             if _client is None:
                 _client = _connect(cfg.weaviate_url, cfg.weaviate_api_key)
@@ -1,15 +1,21 @@
 """Shared utilities for Weaviate store functions.
 
-Provides the enabled guard, timestamp helper, and logger used
-by all domain-specific store modules.
+Provides the enabled guard, timestamp helper, write runner, and logger
+used by all domain-specific store modules.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime, timezone
+from typing import TypeVar
 
 from ..config import get_config
+from ..search_cache import invalidate_search_results
+
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
@@ -22,3 +28,15 @@ def _is_enabled() -> bool:
 def _now() -> datetime:
     """Return current UTC datetime (Weaviate accepts datetime objects directly)."""
     return datetime.now(timezone.utc)
+
+
+async def _run_write(fn: Callable[[], T]) -> T:
+    """Run a blocking Weaviate write in a worker thread, then invalidate search caches.
+
+    Invalidation also runs when the write raises, since multi-object
+    writes may have stored some objects before failing.
+    """
+    try:
+        return await asyncio.to_thread(fn)
+    finally:
+        invalidate_search_results()
@@ -2,10 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
-
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_call_notes(notes: dict) -> str | None:
@@ -41,7 +39,7 @@ async def store_call_notes(notes: dict) -> str | None:
                 "local_filepath": notes.get("local_filepath", ""),
             }))
 
-        return await asyncio.to_thread(_insert)
+        return await _run_write(_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 
 import weaviate.util
 
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_community_reaction(reaction: dict) -> str | None:
@@ -64,7 +63,7 @@ async def store_community_reaction(reaction: dict) -> str | None:
 
             return str(collection.data.insert(properties=props))
 
-        return await asyncio.to_thread(_upsert)
+        return await _run_write(_upsert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
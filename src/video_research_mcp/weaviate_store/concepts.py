@@ -2,13 +2,11 @@
 
 from __future__ import annotations
 
-import asyncio
-
 import weaviate.util
 from weaviate.classes.data import DataObject
 
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_concept_knowledge(concept: dict) -> str | None:
@@ -54,7 +52,7 @@ async def store_concept_knowledge(concept: dict) -> str | None:
 
             return str(collection.data.insert(properties=props))
 
-        return await asyncio.to_thread(_upsert)
+        return await _run_write(_upsert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -94,7 +92,7 @@ async def store_relationship_edges(edges: list[dict]) -> list[str] | None:
             result = collection.data.insert_many(objects)
             return [str(obj.uuid) for obj in result.all_objects]
 
-        return await asyncio.to_thread(_batch_insert)
+        return await _run_write(_batch_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_content_analysis(
@@ -44,7 +43,7 @@ async def store_content_analysis(
                 "local_filepath": local_filepath,
             }))
 
-        return await asyncio.to_thread(_insert)
+        return await _run_write(_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
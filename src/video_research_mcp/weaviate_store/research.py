@@ -2,13 +2,12 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 
 from weaviate.classes.data import DataObject
 
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_research_finding(report_dict: dict) -> list[str] | None:
@@ -87,7 +86,7 @@ async def store_research_finding(report_dict: dict) -> list[str] | None:
 
             return uuids
 
-        return await asyncio.to_thread(_insert_all)
+        return await _run_write(_insert_all)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -118,7 +117,7 @@ async def store_research_plan(plan_dict: dict) -> str | None:
                 "recommended_models_json": json.dumps(plan_dict.get("recommended_models", [])),
             }))
 
-        return await asyncio.to_thread(_insert)
+        return await _run_write(_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -157,7 +156,7 @@ async def store_evidence_assessment(assessment_dict: dict) -> str | None:
                 "report_uuid": "",
             }))
 
-        return await asyncio.to_thread(_insert)
+        return await _run_write(_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import asyncio
 import json
 
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_web_search(
@@ -36,7 +35,7 @@ async def store_web_search(
                 "sources_json": json.dumps(sources),
             }))
 
-        return await asyncio.to_thread(_insert)
+        return await _run_write(_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -2,14 +2,13 @@
 
 from __future__ import annotations
 
-import asyncio
 import hashlib
 import json
 
 import weaviate.util
 
 from ..weaviate_client import WeaviateClient
-from ._base import _is_enabled, _now, logger
+from ._base import _is_enabled, _now, _run_write, logger
 
 
 async def store_video_analysis(
@@ -78,7 +77,7 @@ async def store_video_analysis(
 
             return str(collection.data.insert(properties=props))
 
-        return await asyncio.to_thread(_insert)
+        return await _run_write(_insert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
@@ -115,7 +114,7 @@ async def store_video_metadata(meta_dict: dict) -> str | None:
 
             return str(collection.data.insert(properties=props))
 
-        return await asyncio.to_thread(_upsert)
+        return await _run_write(_upsert)
     except Exception as exc:
         logger.warning("Weaviate store failed (non-fatal): %s", exc)
         return None
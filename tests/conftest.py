@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -80,6 +81,19 @@ def _isolate_upload_cache(tmp_path, monkeypatch):
     )
 
 
+@pytest.fixture(autouse=True)
+def _clean_search_caches():
+    """Isolate knowledge_search's result cache and the Weaviate query semaphore between tests."""
+    from video_research_mcp.search_cache import invalidate_search_results
+    from video_research_mcp.tools.knowledge.helpers import _reset_query_slots
+
+    invalidate_search_results()
+    _reset_query_slots()
+    yield
+    invalidate_search_results()
+    _reset_query_slots()
+
+
 @pytest.fixture()
 def mock_gemini_client():
     """Patch GeminiClient.get(), .generate(), and .generate_structured() for unit tests."""
@@ -108,6 +122,25 @@ def mock_gemini_client():
         }
 
 
+@pytest.fixture()
+def env_snap():
+    """Snapshot ``os.environ`` and restore it after the test.
+
+    Yields ``os.environ`` itself, so tests set variables with plain item
+    assignment instead of one ``monkeypatch.setenv`` undo entry per key.
+    Restoration only touches keys that were added or changed.
+    """
+    saved = os.environ.copy()
+    try:
+        yield os.environ
+    finally:
+        for key in os.environ.keys() - saved.keys():
+            del os.environ[key]
+        for key, value in saved.items():
+            if os.environ.get(key) != value:
+                os.environ[key] = value
+
+
 @pytest.fixture()
 def clean_config():
     """Reset the config singleton between tests."""
@@ -147,6 +180,15 @@ def mock_weaviate_client():
         }
 
 
+@pytest.fixture()
+def weaviate_url(monkeypatch):
+    """Configure a Weaviate URL; ``mock_weaviate_disabled`` removes it again.
+
+    Modules opt in with ``pytestmark = pytest.mark.usefixtures("weaviate_url")``.
+    """
+    monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
+
+
 @pytest.fixture()
 def mock_weaviate_disabled(monkeypatch, clean_config):
     """Ensure Weaviate is disabled — empty WEAVIATE_URL."""
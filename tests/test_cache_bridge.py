@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -147,7 +148,6 @@ class TestEnsureSessionCache:
 
     async def test_returns_timeout_reason(self):
         """GIVEN slow cache creation WHEN timeout exceeded THEN returns timeout reason."""
-        import asyncio
         from video_research_mcp.tools.video_cache import ensure_session_cache
 
         real_wait_for = asyncio.wait_for
@@ -174,7 +174,6 @@ class TestEnsureSessionCache:
         """GIVEN a slow prewarm that outlasts lookup_or_await's timeout
         WHEN ensure_session_cache falls to slow path THEN joins the pending
         task via start_prewarm instead of creating a duplicate cache."""
-        import asyncio
         from video_research_mcp.tools.video_cache import ensure_session_cache
 
         mock_cached = MagicMock()
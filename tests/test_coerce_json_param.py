@@ -78,3 +78,20 @@ class TestCoerceJsonParamList:
     def test_empty_list_string(self):
         """Empty JSON array string is parsed."""
         assert coerce_json_param("[]", list) == []
+
+    def test_leading_whitespace_is_parsed(self):
+        """Whitespace before the opening bracket is still valid JSON."""
+        assert coerce_json_param('  ["a"]', list) == ["a"]
+
+    def test_plain_string_skips_decoder(self, monkeypatch):
+        """GIVEN a bare string that cannot be a JSON array,
+        WHEN coerce_json_param is called with expected_type=list,
+        THEN it is returned without invoking json.loads.
+        """
+        import video_research_mcp.types as types_mod
+
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("json.loads should not be called")
+
+        monkeypatch.setattr(types_mod.json, "loads", _fail)
+        assert coerce_json_param("ResearchFindings", list) == "ResearchFindings"
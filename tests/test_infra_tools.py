@@ -5,19 +5,19 @@ from __future__ import annotations
 import pytest
 
 import video_research_mcp.config as cfg_mod
+from video_research_mcp.config import MODEL_PRESETS
 from video_research_mcp.tools.infra import infra_cache, infra_configure
 
 
 @pytest.fixture(autouse=True)
-def _clean_config(monkeypatch):
-    monkeypatch.setenv("GEMINI_API_KEY", "test")
+def _clean_config(env_snap):
+    env_snap["GEMINI_API_KEY"] = "test"
     cfg_mod._config = None
     yield
     cfg_mod._config = None
 
 
 class TestInfraTools:
-    @pytest.mark.asyncio
     async def test_infra_configure_updates_runtime_config(self):
         out = await infra_configure(model="gemini-test", thinking_level="low", temperature=0.7)
         cfg = out["current_config"]
@@ -26,21 +26,28 @@ class TestInfraTools:
         assert cfg["default_temperature"] == 0.7
         assert "gemini_api_key" not in cfg
 
-    @pytest.mark.asyncio
+    async def test_infra_configure_redacts_all_secret_fields(self, env_snap):
+        env_snap["YOUTUBE_API_KEY"] = "yt-secret"
+        env_snap["WEAVIATE_API_KEY"] = "wv-secret"
+        out = await infra_configure()
+        cfg = out["current_config"]
+        for key in ("gemini_api_key", "youtube_api_key", "weaviate_api_key"):
+            assert key not in cfg
+        assert "secret" not in str(cfg)
+
     async def test_infra_configure_invalid_thinking_level_returns_error(self):
         out = await infra_configure(thinking_level="ultra")
         assert out["category"] == "API_INVALID_ARGUMENT"
         assert out["retryable"] is False
 
-    @pytest.mark.asyncio
-    async def test_preset_sets_both_models(self):
-        out = await infra_configure(preset="stable")
+    @pytest.mark.parametrize("preset", sorted(MODEL_PRESETS))
+    async def test_preset_sets_both_models(self, preset):
+        out = await infra_configure(preset=preset)
         cfg = out["current_config"]
-        assert cfg["default_model"] == "gemini-3-pro-preview"
-        assert cfg["flash_model"] == "gemini-3-flash-preview"
-        assert out["active_preset"] == "stable"
+        assert cfg["default_model"] == MODEL_PRESETS[preset]["default_model"]
+        assert cfg["flash_model"] == MODEL_PRESETS[preset]["flash_model"]
+        assert out["active_preset"] == preset
 
-    @pytest.mark.asyncio
     async def test_preset_with_model_override(self):
         out = await infra_configure(preset="stable", model="gemini-3-pro-exp-override")
         cfg = out["current_config"]
@@ -48,25 +55,28 @@ class TestInfraTools:
         assert cfg["flash_model"] == "gemini-3-flash-preview"
         assert out["active_preset"] is None  # no exact preset match
 
-    @pytest.mark.asyncio
     async def test_invalid_preset_returns_error(self):
         out = await infra_configure(preset="turbo")
         assert out["category"] == "UNKNOWN"
         assert "Unknown preset" in out["error"]
 
-    @pytest.mark.asyncio
     async def test_response_includes_presets(self):
         out = await infra_configure()
         assert "available_presets" in out
         assert set(out["available_presets"]) == {"best", "stable", "budget"}
         assert out["active_preset"] == "best"  # default models match "best"
 
-    @pytest.mark.asyncio
+    async def test_presets_not_shared_between_responses(self):
+        """GIVEN a caller mutates available_presets WHEN configuring again THEN the next response is intact."""
+        (await infra_configure())["available_presets"].clear()
+        out = await infra_configure()
+        assert set(out["available_presets"]) == {"best", "stable", "budget"}
+
     async def test_infra_cache_unknown_action(self):
         out = await infra_cache(action="wat")
         assert "Unknown action" in out["error"]
+        assert out["valid_actions"] == ["stats", "list", "clear", "context"]
 
-    @pytest.mark.asyncio
     async def test_infra_cache_context_action(self):
         """GIVEN cache subsystem state WHEN action=context THEN returns diagnostic dict."""
         import video_research_mcp.context_cache as cc_mod
@@ -2,147 +2,152 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
 
+import pytest
 
-AGENT_MODULE = "video_research_mcp.tools.knowledge.agent"
+from video_research_mcp.tools.knowledge import agent as _agent_mod
+from video_research_mcp.tools.knowledge.agent import (
+    _get_query_agent,
+    _reset_query_agent_cache,
+    knowledge_ask,
+    knowledge_query,
+)
+from video_research_mcp.weaviate_client import WeaviateClient
 
+pytestmark = pytest.mark.usefixtures("weaviate_url")
+
+
+@dataclass(slots=True)
+class FakeQueryAgent:
+    """Hand-written AsyncQueryAgent stand-in with canned responses.
+
+    Records every ask/search call in ``calls`` and every ``_get_query_agent``
+    collections argument in ``lookups``; raises ``error`` when set.
+    """
+
+    ask_return: Any = field(
+        default_factory=lambda: SimpleNamespace(final_answer="ok", sources=[]),
+    )
+    search_return: Any = field(
+        default_factory=lambda: SimpleNamespace(search_results=SimpleNamespace(objects=[])),
+    )
+    error: Exception | None = None
+    calls: list[tuple] = field(default_factory=list)
+    lookups: list[list[str] | None] = field(default_factory=list)
+
+    async def ask(self, query):
+        self.calls.append(("ask", query))
+        if self.error is not None:
+            raise self.error
+        return self.ask_return
+
+    async def search(self, query, limit=10):
+        self.calls.append(("search", query, limit))
+        if self.error is not None:
+            raise self.error
+        return self.search_return
+
+
+@pytest.fixture()
+def fake_agent(monkeypatch):
+    """Make _get_query_agent return a FakeQueryAgent and mark weaviate-agents installed."""
+    agent = FakeQueryAgent()
+
+    async def _get_query_agent(collections=None):
+        agent.lookups.append(collections)
+        return agent
+
+    monkeypatch.setattr(_agent_mod, "_HAS_QUERY_AGENT", True)
+    monkeypatch.setattr(_agent_mod, "_get_query_agent", _get_query_agent)
+    return agent
+
+
+AGENT_TOOLS = [
+    pytest.param(knowledge_ask, "What is RAG?", id="knowledge_ask"),
+    pytest.param(knowledge_query, "RAG systems", id="knowledge_query"),
+]
 
-class TestKnowledgeAsk:
-    """Tests for knowledge_ask tool."""
 
+class TestAgentToolsShared:
+    """Behavior shared by knowledge_ask and knowledge_query."""
+
+    @pytest.mark.parametrize(("tool", "query"), AGENT_TOOLS)
     async def test_returns_error_when_agent_not_installed(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, clean_config, monkeypatch, tool, query
     ):
-        """GIVEN weaviate-agents is not installed WHEN knowledge_ask is called THEN returns import error."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        with patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", False):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            result = await knowledge_ask(query="What is RAG?")
+        """GIVEN weaviate-agents is not installed WHEN the tool is called THEN returns import error."""
+        monkeypatch.setattr(_agent_mod, "_HAS_QUERY_AGENT", False)
+        result = await tool(query=query)
         assert "error" in result
         assert "weaviate-agents" in result["error"]
 
-    async def test_returns_error_when_weaviate_disabled(self, mock_weaviate_disabled):
-        """GIVEN Weaviate is not configured WHEN knowledge_ask is called THEN returns not-configured error."""
-        with patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            result = await knowledge_ask(query="What is RAG?")
+    @pytest.mark.parametrize(("tool", "query"), AGENT_TOOLS)
+    async def test_returns_error_when_weaviate_disabled(
+        self, mock_weaviate_disabled, monkeypatch, tool, query
+    ):
+        """GIVEN Weaviate is not configured WHEN the tool is called THEN returns not-configured error."""
+        monkeypatch.setattr(_agent_mod, "_HAS_QUERY_AGENT", True)
+        result = await tool(query=query)
         assert "error" in result
         assert "not configured" in result["error"]
 
-    async def test_returns_answer_with_sources(
-        self, mock_weaviate_client, clean_config, monkeypatch
+    @pytest.mark.parametrize(("tool", "query"), AGENT_TOOLS)
+    @pytest.mark.parametrize(
+        "collections",
+        [
+            pytest.param(["VideoAnalyses", "ResearchFindings"], id="explicit"),
+            pytest.param(["VideoMetadata"], id="single"),
+            pytest.param(None, id="all-collections"),
+        ],
+    )
+    async def test_passes_collections_to_agent(
+        self, clean_config, fake_agent, tool, query, collections
     ):
-        """GIVEN AsyncQueryAgent returns answer+sources WHEN knowledge_ask THEN returns structured result."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        source = MagicMock(collection="ResearchFindings", object_id="uuid-abc")
-        mock_agent.ask.return_value = MagicMock(
-            final_answer="RAG combines retrieval with generation.",
-            sources=[source],
-        )
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            result = await knowledge_ask(query="What is RAG?")
+        """GIVEN collections (or none) WHEN the tool is called THEN agent lookup receives them (None = all)."""
+        await tool(query=query, collections=collections)
+        assert fake_agent.lookups == [collections]
 
-        assert result["query"] == "What is RAG?"
-        assert result["answer"] == "RAG combines retrieval with generation."
-        assert len(result["sources"]) == 1
-        assert result["sources"][0]["collection"] == "ResearchFindings"
-        assert result["sources"][0]["object_id"] == "uuid-abc"
 
-    async def test_returns_empty_answer(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN AsyncQueryAgent returns no answer WHEN knowledge_ask THEN answer is empty string."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.ask.return_value = MagicMock(final_answer=None, sources=[])
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            result = await knowledge_ask(query="Unknown question")
-
-        assert result["answer"] == ""
-        assert result["sources"] == []
-
-    async def test_returns_no_sources(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN AsyncQueryAgent returns answer without sources WHEN knowledge_ask THEN sources is empty."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.ask.return_value = MagicMock(
-            final_answer="An answer", sources=None,
-        )
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            result = await knowledge_ask(query="test")
-
-        assert result["answer"] == "An answer"
-        assert result["sources"] == []
+class TestKnowledgeAsk:
+    """Tests for knowledge_ask tool."""
 
-    async def test_passes_collections_to_agent(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN specific collections WHEN knowledge_ask THEN agent receives those collections."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.ask.return_value = MagicMock(final_answer="ok", sources=[])
-
-        mock_get = AsyncMock(return_value=mock_agent)
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", mock_get),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            await knowledge_ask(
-                query="test", collections=["VideoAnalyses", "ResearchFindings"],
-            )
-            mock_get.assert_called_once_with(["VideoAnalyses", "ResearchFindings"])
-
-    async def test_defaults_to_all_collections(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN no collections specified WHEN knowledge_ask THEN passes None (all collections)."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.ask.return_value = MagicMock(final_answer="ok", sources=[])
-
-        mock_get = AsyncMock(return_value=mock_agent)
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", mock_get),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            await knowledge_ask(query="test")
-            mock_get.assert_called_once_with(None)
-
-    async def test_handles_agent_exception(
-        self, mock_weaviate_client, clean_config, monkeypatch
+    @pytest.mark.parametrize(
+        ("final_answer", "sources", "expected_answer", "expected_sources"),
+        [
+            pytest.param(
+                "RAG combines retrieval with generation.",
+                [SimpleNamespace(collection="ResearchFindings", object_id="uuid-abc")],
+                "RAG combines retrieval with generation.",
+                [{"collection": "ResearchFindings", "object_id": "uuid-abc"}],
+                id="answer-with-sources",
+            ),
+            pytest.param(None, [], "", [], id="empty-answer"),
+            pytest.param("An answer", None, "An answer", [], id="no-sources"),
+        ],
+    )
+    async def test_returns_answer(
+        self, clean_config, fake_agent,
+        final_answer, sources, expected_answer, expected_sources,
     ):
+        """GIVEN AsyncQueryAgent answer/sources WHEN knowledge_ask THEN both are normalized."""
+        fake_agent.ask_return = SimpleNamespace(final_answer=final_answer, sources=sources)
+
+        result = await knowledge_ask(query="What is RAG?")
+
+        assert result["query"] == "What is RAG?"
+        assert result["answer"] == expected_answer
+        assert result["sources"] == expected_sources
+
+    async def test_handles_agent_exception(self, clean_config, fake_agent):
         """GIVEN AsyncQueryAgent raises WHEN knowledge_ask THEN returns error dict."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.ask.side_effect = RuntimeError("Agent failed")
+        fake_agent.error = RuntimeError("Agent failed")
 
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_ask
-            result = await knowledge_ask(query="test")
+        result = await knowledge_ask(query="test")
 
         assert "error" in result
         assert "Agent failed" in result["error"]
@@ -151,168 +156,63 @@ class TestKnowledgeAsk:
 class TestKnowledgeQuery:
     """Tests for knowledge_query tool."""
 
-    async def test_returns_error_when_agent_not_installed(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN weaviate-agents is not installed WHEN knowledge_query THEN returns import error."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        with patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", False):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="RAG systems")
-        assert "error" in result
-        assert "weaviate-agents" in result["error"]
-
-    async def test_returns_error_when_weaviate_disabled(self, mock_weaviate_disabled):
-        """GIVEN Weaviate is not configured WHEN knowledge_query THEN returns not-configured error."""
-        with patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="RAG systems")
-        assert "error" in result
-        assert "not configured" in result["error"]
-
+    @pytest.mark.parametrize(
+        ("search_results", "expected_results"),
+        [
+            pytest.param(
+                SimpleNamespace(objects=[
+                    SimpleNamespace(
+                        collection="ResearchFindings",
+                        uuid="uuid-1",
+                        properties={"claim": "RAG improves accuracy"},
+                    ),
+                    SimpleNamespace(
+                        collection="VideoAnalyses",
+                        uuid="uuid-2",
+                        properties={"title": "RAG Tutorial"},
+                    ),
+                ]),
+                [
+                    ("ResearchFindings", "uuid-1", {"claim": "RAG improves accuracy"}),
+                    ("VideoAnalyses", "uuid-2", {"title": "RAG Tutorial"}),
+                ],
+                id="objects",
+            ),
+            pytest.param(SimpleNamespace(objects=[]), [], id="no-objects"),
+            pytest.param(None, [], id="none-search-results"),
+        ],
+    )
     async def test_returns_search_results(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, clean_config, fake_agent, search_results, expected_results,
     ):
-        """GIVEN AsyncQueryAgent returns objects WHEN knowledge_query THEN returns KnowledgeQueryResult."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj1 = MagicMock(
-            collection="ResearchFindings",
-            uuid="uuid-1",
-            properties={"claim": "RAG improves accuracy"},
-        )
-        obj2 = MagicMock(
-            collection="VideoAnalyses",
-            uuid="uuid-2",
-            properties={"title": "RAG Tutorial"},
-        )
-        mock_agent = AsyncMock()
-        mock_agent.search.return_value = MagicMock(
-            search_results=MagicMock(objects=[obj1, obj2]),
-        )
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="RAG systems")
+        """GIVEN AsyncQueryAgent search objects WHEN knowledge_query THEN returns KnowledgeQueryResult."""
+        fake_agent.search_return = SimpleNamespace(search_results=search_results)
+
+        result = await knowledge_query(query="RAG systems")
 
         assert result["query"] == "RAG systems"
-        assert result["total_results"] == 2
-        assert len(result["results"]) == 2
-        assert result["results"][0]["collection"] == "ResearchFindings"
-        assert result["results"][0]["properties"]["claim"] == "RAG improves accuracy"
-        assert result["results"][1]["collection"] == "VideoAnalyses"
-
-    async def test_returns_empty_results(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN AsyncQueryAgent returns no objects WHEN knowledge_query THEN returns empty list."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.search.return_value = MagicMock(
-            search_results=MagicMock(objects=[]),
-        )
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="nonexistent topic")
-
-        assert result["total_results"] == 0
-        assert result["results"] == []
+        assert result["total_results"] == len(expected_results)
+        assert [
+            (r["collection"], r["object_id"], r["properties"]) for r in result["results"]
+        ] == expected_results
 
-    async def test_passes_collections_to_agent(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN specific collections WHEN knowledge_query THEN agent receives them."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.search.return_value = MagicMock(
-            search_results=MagicMock(objects=[]),
-        )
-
-        mock_get = AsyncMock(return_value=mock_agent)
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", mock_get),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            await knowledge_query(query="test", collections=["VideoMetadata"])
-            mock_get.assert_called_once_with(["VideoMetadata"])
-
-    async def test_passes_limit_to_search(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
+    async def test_passes_limit_to_search(self, clean_config, fake_agent):
         """GIVEN custom limit WHEN knowledge_query THEN passes limit to agent.search()."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.search.return_value = MagicMock(
-            search_results=MagicMock(objects=[]),
-        )
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            await knowledge_query(query="test", limit=25)
-            mock_agent.search.assert_called_once_with("test", limit=25)
-
-    async def test_handles_agent_exception(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
+        await knowledge_query(query="test", limit=25)
+        assert fake_agent.calls == [("search", "test", 25)]
+
+    async def test_handles_agent_exception(self, clean_config, fake_agent):
         """GIVEN AsyncQueryAgent raises WHEN knowledge_query THEN returns error dict."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.search.side_effect = RuntimeError("Search failed")
+        fake_agent.error = RuntimeError("Search failed")
 
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="test")
+        result = await knowledge_query(query="test")
 
         assert "error" in result
         assert "Search failed" in result["error"]
 
-    async def test_handles_none_search_results(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """GIVEN search_results is None WHEN knowledge_query THEN returns empty results."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.search.return_value = MagicMock(search_results=None)
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="test")
-
-        assert result["total_results"] == 0
-        assert result["results"] == []
-
-    async def test_returns_deprecation_notice(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
+    async def test_returns_deprecation_notice(self, clean_config, fake_agent):
         """GIVEN knowledge_query called WHEN returns result THEN includes deprecation fields."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agent = AsyncMock()
-        mock_agent.search.return_value = MagicMock(
-            search_results=MagicMock(objects=[]),
-        )
-
-        with (
-            patch(f"{AGENT_MODULE}._HAS_QUERY_AGENT", True),
-            patch(f"{AGENT_MODULE}._get_query_agent", new_callable=AsyncMock, return_value=mock_agent),
-        ):
-            from video_research_mcp.tools.knowledge.agent import knowledge_query
-            result = await knowledge_query(query="test")
+        result = await knowledge_query(query="test")
 
         assert result["_deprecated"] is True
         assert "knowledge_search" in result["_deprecation_notice"]
@@ -321,62 +221,59 @@ class TestKnowledgeQuery:
 class TestQueryAgentSingleton:
     """Tests for the _get_query_agent async caching behavior."""
 
-    async def test_caches_by_collection_set(self, mock_weaviate_client):
+    @pytest.fixture()
+    def singleton_env(self, monkeypatch):
+        """Isolate the agent cache; yield (AsyncQueryAgent mock, set_client helper).
+
+        ``set_client(c)`` makes ``WeaviateClient.aget()`` return *c* until the
+        next call, so tests can simulate a reconnect mid-test.
+        """
+        mock_qa_class = MagicMock()
+        monkeypatch.setattr(_agent_mod, "AsyncQueryAgent", mock_qa_class, raising=False)
+        monkeypatch.setattr(_agent_mod, "_agent_lock", asyncio.Lock())
+
+        def set_client(client):
+            monkeypatch.setattr(WeaviateClient, "aget", AsyncMock(return_value=client))
+
+        _reset_query_agent_cache()
+        yield mock_qa_class, set_client
+        _reset_query_agent_cache()
+
+    async def test_caches_by_collection_set(self, mock_weaviate_client, singleton_env):
         """GIVEN same collections WHEN _get_query_agent called twice THEN returns same instance."""
-        import asyncio
-        with patch(f"{AGENT_MODULE}._query_agents", {}):
-            mock_qa_class = MagicMock()
-            with (
-                patch(f"{AGENT_MODULE}.AsyncQueryAgent", mock_qa_class, create=True),
-                patch(f"{AGENT_MODULE}._agent_lock", asyncio.Lock()),
-                patch("video_research_mcp.weaviate_client.WeaviateClient.aget", new_callable=AsyncMock, return_value=mock_weaviate_client["client"]),
-            ):
-                from video_research_mcp.tools.knowledge.agent import _get_query_agent
-                agent1 = await _get_query_agent(["VideoAnalyses", "ResearchFindings"])
-                agent2 = await _get_query_agent(["ResearchFindings", "VideoAnalyses"])
-                # Same sorted tuple + same client → same agent
-                assert agent1 is agent2
-                assert mock_qa_class.call_count == 1
-
-    async def test_different_collections_get_different_agents(self, mock_weaviate_client):
+        mock_qa_class, set_client = singleton_env
+        set_client(mock_weaviate_client["client"])
+        agent1 = await _get_query_agent(["VideoAnalyses", "ResearchFindings"])
+        agent2 = await _get_query_agent(["ResearchFindings", "VideoAnalyses"])
+        # Same sorted tuple + same client → same agent
+        assert agent1 is agent2
+        assert mock_qa_class.call_count == 1
+
+    async def test_different_collections_get_different_agents(
+        self, mock_weaviate_client, singleton_env
+    ):
         """GIVEN different collections WHEN _get_query_agent called THEN returns different instances."""
-        import asyncio
-        with patch(f"{AGENT_MODULE}._query_agents", {}):
-            mock_qa_class = MagicMock()
-            with (
-                patch(f"{AGENT_MODULE}.AsyncQueryAgent", mock_qa_class, create=True),
-                patch(f"{AGENT_MODULE}._agent_lock", asyncio.Lock()),
-                patch("video_research_mcp.weaviate_client.WeaviateClient.aget", new_callable=AsyncMock, return_value=mock_weaviate_client["client"]),
-            ):
-                from video_research_mcp.tools.knowledge.agent import _get_query_agent
-                await _get_query_agent(["VideoAnalyses"])
-                await _get_query_agent(["ResearchFindings"])
-                assert mock_qa_class.call_count == 2
-
-    async def test_invalidates_on_client_change(self, mock_weaviate_client):
+        mock_qa_class, set_client = singleton_env
+        set_client(mock_weaviate_client["client"])
+        await _get_query_agent(["VideoAnalyses"])
+        await _get_query_agent(["ResearchFindings"])
+        assert mock_qa_class.call_count == 2
+
+    async def test_invalidates_on_client_change(self, singleton_env):
         """GIVEN cached agent WHEN WeaviateClient.aget() returns new client THEN creates new agent."""
-        import asyncio
-        client_a = MagicMock(name="client-A")
-        client_b = MagicMock(name="client-B")
+        mock_qa_class, set_client = singleton_env
         agent_a = MagicMock(name="agent-A")
         agent_b = MagicMock(name="agent-B")
+        mock_qa_class.side_effect = [agent_a, agent_b]
+
+        # First call caches agent bound to client_a
+        set_client(MagicMock(name="client-A"))
+        result_a = await _get_query_agent(["VideoAnalyses"])
+
+        # Second call with new client → cache miss → new agent
+        set_client(MagicMock(name="client-B"))
+        result_b = await _get_query_agent(["VideoAnalyses"])
 
-        with patch(f"{AGENT_MODULE}._query_agents", {}):
-            mock_qa_class = MagicMock(side_effect=[agent_a, agent_b])
-            with (
-                patch(f"{AGENT_MODULE}.AsyncQueryAgent", mock_qa_class, create=True),
-                patch(f"{AGENT_MODULE}._agent_lock", asyncio.Lock()),
-            ):
-                from video_research_mcp.tools.knowledge.agent import _get_query_agent
-
-                # First call caches agent bound to client_a
-                with patch("video_research_mcp.weaviate_client.WeaviateClient.aget", new_callable=AsyncMock, return_value=client_a):
-                    result_a = await _get_query_agent(["VideoAnalyses"])
-
-                # Second call with new client → cache miss → new agent
-                with patch("video_research_mcp.weaviate_client.WeaviateClient.aget", new_callable=AsyncMock, return_value=client_b):
-                    result_b = await _get_query_agent(["VideoAnalyses"])
-
-                assert result_a is agent_a
-                assert result_b is agent_b
-                assert mock_qa_class.call_count == 2
+        assert result_a is agent_a
+        assert result_b is agent_b
+        assert mock_qa_class.call_count == 2
@@ -5,9 +5,11 @@ from __future__ import annotations
 from video_research_mcp.tools.knowledge_filters import build_collection_filter
 
 # Simulate allowed properties for different collections
-_RESEARCH_PROPS = {"created_at", "source_tool", "topic", "evidence_tier", "claim", "report_uuid"}
-_VIDEO_ANALYSIS_PROPS = {"created_at", "source_tool", "video_id", "title", "summary"}
-_VIDEO_METADATA_PROPS = {"created_at", "source_tool", "video_id", "category", "channel_id"}
+_RESEARCH_PROPS = frozenset(
+    {"created_at", "source_tool", "topic", "evidence_tier", "claim", "report_uuid"}
+)
+_VIDEO_ANALYSIS_PROPS = frozenset({"created_at", "source_tool", "video_id", "title", "summary"})
+_VIDEO_METADATA_PROPS = frozenset({"created_at", "source_tool", "video_id", "category", "channel_id"})
 
 
 class TestBuildCollectionFilter:
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass, field
+from typing import Any
+
+import pytest
+
+from video_research_mcp.client import GeminiClient
 from video_research_mcp.models.knowledge import (
     HitSummary,
     HitSummaryBatch,
     KnowledgeHit,
 )
+from video_research_mcp.tools.knowledge.summarize import summarize_hits
 
 
 def _make_hit(object_id: str, collection: str = "VideoAnalyses", **props) -> KnowledgeHit:
@@ -18,112 +25,138 @@ def _make_hit(object_id: str, collection: str = "VideoAnalyses", **props) -> Kno
     )
 
 
+# Read-only input for test_caps_batch_size; already well-typed, so skip validation.
+_CAP_HITS = [
+    KnowledgeHit.model_construct(
+        collection="VideoAnalyses",
+        object_id=f"uuid-{i}",
+        score=0.5,
+        properties={"title": f"Hit {i}"},
+    )
+    for i in range(120)
+]
+
+# Canned Flash responses; model_construct skips validation of known-good test data.
+_EMPTY_BATCH = HitSummaryBatch.model_construct(summaries=[])
+
+
+def _summary(
+    object_id: str, summary: str, useful_properties: list[str], relevance: float = 0.5,
+) -> HitSummary:
+    return HitSummary.model_construct(
+        object_id=object_id,
+        relevance=relevance,
+        summary=summary,
+        useful_properties=useful_properties,
+    )
+
+
+def _batch(*summaries: HitSummary) -> HitSummaryBatch:
+    return HitSummaryBatch.model_construct(summaries=list(summaries))
+
+
+@dataclass
+class FakeGenerateStructured:
+    """Hand-written stand-in for ``GeminiClient.generate_structured``.
+
+    Returns ``ret`` (or raises ``exc`` when set) and records each call as
+    ``(contents, kwargs)`` in ``calls``.
+    """
+
+    ret: Any = field(default_factory=lambda: _EMPTY_BATCH)
+    exc: Exception | None = None
+    calls: list[tuple[Any, dict]] = field(default_factory=list)
+
+    async def __call__(self, contents, **kwargs):
+        self.calls.append((contents, kwargs))
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
+
+
+@pytest.fixture()
+def fake_generate(monkeypatch):
+    """Replace GeminiClient.generate_structured with a FakeGenerateStructured."""
+    fake = FakeGenerateStructured()
+    monkeypatch.setattr(GeminiClient, "generate_structured", fake)
+    return fake
+
+
 class TestSummarizeHits:
     """Tests for summarize_hits Flash post-processor."""
 
-    async def test_enriches_hits_with_summary(self, mock_gemini_client):
+    async def test_enriches_hits_with_summary(self, fake_generate):
         """GIVEN Flash returns summaries WHEN summarize_hits THEN hits get summary field."""
         hits = [_make_hit("uuid-1", title="AI Research", abstract="Long text")]
-        mock_gemini_client["generate_structured"].return_value = HitSummaryBatch(
-            summaries=[HitSummary(
-                object_id="uuid-1",
-                relevance=0.9,
-                summary="Relevant AI research paper",
-                useful_properties=["title", "abstract"],
-            )],
+        fake_generate.ret = _batch(
+            _summary("uuid-1", "Relevant AI research paper", ["title", "abstract"], relevance=0.9),
         )
 
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
         result = await summarize_hits(hits, "AI")
 
         assert len(result) == 1
         assert result[0].summary == "Relevant AI research paper"
 
-    async def test_trims_properties_to_useful(self, mock_gemini_client):
+    async def test_trims_properties_to_useful(self, fake_generate):
         """GIVEN Flash identifies useful_properties WHEN summarize_hits THEN extra props removed."""
         hits = [_make_hit("uuid-1", title="Keep", extra="Remove", other="Also remove")]
-        mock_gemini_client["generate_structured"].return_value = HitSummaryBatch(
-            summaries=[HitSummary(
-                object_id="uuid-1",
-                relevance=0.8,
-                summary="Summary",
-                useful_properties=["title"],
-            )],
+        fake_generate.ret = _batch(
+            _summary("uuid-1", "Summary", ["title"], relevance=0.8),
         )
 
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
         result = await summarize_hits(hits, "test")
 
         assert "title" in result[0].properties
         assert "extra" not in result[0].properties
         assert "other" not in result[0].properties
 
-    async def test_fallback_on_error(self, mock_gemini_client):
+    async def test_fallback_on_error(self, fake_generate):
         """GIVEN Flash raises WHEN summarize_hits THEN returns raw hits unchanged."""
         hits = [_make_hit("uuid-1", title="Original")]
-        mock_gemini_client["generate_structured"].side_effect = RuntimeError("Flash failed")
+        fake_generate.exc = RuntimeError("Flash failed")
 
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
         result = await summarize_hits(hits, "test")
 
         assert len(result) == 1
         assert result[0].summary is None
         assert result[0].properties["title"] == "Original"
 
-    async def test_skips_empty_hits(self, mock_gemini_client):
+    async def test_skips_empty_hits(self, fake_generate):
         """GIVEN empty list WHEN summarize_hits THEN returns empty, no Flash call."""
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
         result = await summarize_hits([], "test")
 
         assert result == []
-        mock_gemini_client["generate_structured"].assert_not_called()
+        assert fake_generate.calls == []
 
-    async def test_caps_batch_size(self, mock_gemini_client):
+    async def test_caps_batch_size(self, fake_generate):
         """GIVEN 120 hits WHEN summarize_hits THEN prompt only contains first 100."""
-        hits = [_make_hit(f"uuid-{i}", title=f"Hit {i}") for i in range(120)]
-        mock_gemini_client["generate_structured"].return_value = HitSummaryBatch(summaries=[])
-
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
-        await summarize_hits(hits, "test")
+        await summarize_hits(_CAP_HITS, "test")
 
-        call_args = mock_gemini_client["generate_structured"].call_args
-        prompt = call_args[0][0]  # first positional arg (contents)
+        [(prompt, _)] = fake_generate.calls
         # Should contain Hit 0 through Hit 99 but not Hit 100+
         assert "uuid-99" in prompt
         assert "uuid-100" not in prompt
 
-    async def test_preserves_all_props_when_useful_empty(self, mock_gemini_client):
+    async def test_preserves_all_props_when_useful_empty(self, fake_generate):
         """GIVEN Flash returns empty useful_properties WHEN summarize_hits THEN all props kept."""
         hits = [_make_hit("uuid-1", title="Keep", extra="Also keep")]
-        mock_gemini_client["generate_structured"].return_value = HitSummaryBatch(
-            summaries=[HitSummary(
-                object_id="uuid-1",
-                relevance=0.5,
-                summary="Summary",
-                useful_properties=[],
-            )],
+        fake_generate.ret = _batch(
+            _summary("uuid-1", "Summary", []),
         )
 
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
         result = await summarize_hits(hits, "test")
 
         # Falls back to all properties when useful_properties is empty
         assert "title" in result[0].properties
         assert "extra" in result[0].properties
 
-    async def test_unmatched_hits_pass_through(self, mock_gemini_client):
+    async def test_unmatched_hits_pass_through(self, fake_generate):
         """GIVEN Flash returns no summary for a hit WHEN summarize_hits THEN hit unchanged."""
         hits = [_make_hit("uuid-1", title="A"), _make_hit("uuid-2", title="B")]
-        mock_gemini_client["generate_structured"].return_value = HitSummaryBatch(
-            summaries=[HitSummary(
-                object_id="uuid-1",
-                relevance=0.9,
-                summary="Summary for A",
-                useful_properties=["title"],
-            )],
+        fake_generate.ret = _batch(
+            _summary("uuid-1", "Summary for A", ["title"], relevance=0.9),
         )
 
-        from video_research_mcp.tools.knowledge.summarize import summarize_hits
         result = await summarize_hits(hits, "test")
 
         assert result[0].summary == "Summary for A"
@@ -2,26 +2,135 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+import time
+from collections import namedtuple
+from dataclasses import dataclass, field
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
+import pytest
+from weaviate.classes.query import HybridFusion
+
+from video_research_mcp.config import update_config
+from video_research_mcp.models.knowledge import HitSummary, HitSummaryBatch
+from video_research_mcp.tools.knowledge import (
+    knowledge_fetch,
+    knowledge_ingest,
+    knowledge_related,
+    knowledge_search,
+    knowledge_stats,
+)
+from video_research_mcp.tools.knowledge.helpers import ALL_COLLECTION_NAMES
+from video_research_mcp.weaviate_store import store_content_analysis
+
+pytestmark = pytest.mark.usefixtures("weaviate_url")
+
+# Immutable stand-ins for Weaviate metadata/aggregate records (attribute access only).
+_Meta = namedtuple("_Meta", ["score", "distance", "rerank_score"], defaults=[None, None, None])
+_Grouped = namedtuple("_Grouped", ["value"])
+_Group = namedtuple("_Group", ["grouped_by", "total_count"])
+
+
+@dataclass(slots=True, frozen=True)
+class _FakeObject:
+    """Weaviate query result object (uuid, properties, metadata)."""
+
+    uuid: str
+    properties: dict
+    metadata: _Meta
+
+
+@dataclass(slots=True, frozen=True)
+class _FakeResponse:
+    """Weaviate query response; only ``objects`` is read by the tools."""
+
+    objects: list[_FakeObject] = field(default_factory=list)
+
+
+def _obj(uuid, properties, **metadata):
+    """Build a Weaviate result object; *metadata* sets score/distance/rerank_score."""
+    return _FakeObject(uuid, properties, _Meta(**metadata))
+
+
+def _queried(mock_weaviate_client) -> set[str]:
+    """Collection names passed to ``client.collections.get``, in any order."""
+    return {c.args[0] for c in mock_weaviate_client["client"].collections.get.call_args_list}
+
+
+class TestKnowledgeToolsDisabled:
+    """Every knowledge tool degrades gracefully when Weaviate is not configured."""
+
+    @pytest.mark.parametrize(
+        ("tool", "kwargs", "check"),
+        [
+            pytest.param(
+                knowledge_search, {"query": "AI research"},
+                lambda r: r["query"] == "AI research" and r["total_results"] == 0,
+                id="search",
+            ),
+            pytest.param(
+                knowledge_related, {"object_id": "test-uuid", "collection": "VideoAnalyses"},
+                lambda r: r["related"] == [],
+                id="related",
+            ),
+            pytest.param(
+                knowledge_stats, {},
+                lambda r: r["total_objects"] == 0,
+                id="stats",
+            ),
+            pytest.param(
+                knowledge_ingest, {"collection": "VideoAnalyses", "properties": {"title": "x"}},
+                lambda r: "error" in r,
+                id="ingest",
+            ),
+            pytest.param(
+                knowledge_fetch, {"object_id": "test-uuid", "collection": "VideoAnalyses"},
+                lambda r: "error" in r,
+                id="fetch",
+            ),
+        ],
+    )
+    async def test_returns_empty_or_error_when_disabled(
+        self, mock_weaviate_disabled, tool, kwargs, check
+    ):
+        """Tool returns an empty result or error dict when Weaviate not configured."""
+        result = await tool(**kwargs)
+        assert check(result), result
+
+    @pytest.mark.parametrize(
+        ("tool", "kwargs", "list_key"),
+        [
+            pytest.param(knowledge_search, {"query": "q"}, "results", id="search"),
+            pytest.param(
+                knowledge_related, {"object_id": "u", "collection": "VideoAnalyses"}, "related",
+                id="related",
+            ),
+            pytest.param(knowledge_stats, {}, "collections", id="stats"),
+        ],
+    )
+    async def test_disabled_results_are_independent(
+        self, mock_weaviate_disabled, tool, kwargs, list_key
+    ):
+        """GIVEN a caller mutates a disabled-mode result WHEN called again THEN the next result is clean."""
+        first = await tool(**kwargs)
+        first[list_key].append("mutated")
+        first["extra"] = True
+
+        second = await tool(**kwargs)
+        assert second[list_key] == []
+        assert "extra" not in second
+
 
 class TestKnowledgeSearch:
     """Tests for knowledge_search tool."""
 
-    async def test_returns_empty_when_disabled(self, mock_weaviate_disabled):
-        """knowledge_search returns empty result when Weaviate not configured."""
-        from video_research_mcp.tools.knowledge import knowledge_search
-        result = await knowledge_search(query="AI research")
-        assert result["query"] == "AI research"
-        assert result["total_results"] == 0
-
     async def test_returns_search_result_structure(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search returns KnowledgeSearchResult dict."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="AI research")
         assert "query" in result
         assert "total_results" in result
@@ -29,53 +138,50 @@ class TestKnowledgeSearch:
         assert result["query"] == "AI research"
 
     async def test_searches_all_collections_by_default(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
-        """knowledge_search queries all 11 collections when none specified."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
+        """knowledge_search queries every collection when none specified."""
         await knowledge_search(query="test")
-        assert mock_weaviate_client["client"].collections.get.call_count == 11
+        assert _queried(mock_weaviate_client) == set(ALL_COLLECTION_NAMES)
 
     async def test_respects_collection_filter(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search only queries specified collections."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         await knowledge_search(query="test", collections=["VideoAnalyses", "VideoMetadata"])
-        assert mock_weaviate_client["client"].collections.get.call_count == 2
+        assert _queried(mock_weaviate_client) == {"VideoAnalyses", "VideoMetadata"}
 
     async def test_returns_ranked_results(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search returns results sorted by score descending."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj1 = MagicMock()
-        obj1.uuid = "uuid-1"
-        obj1.properties = {"title": "First"}
-        obj1.metadata = MagicMock(score=0.9)
-
-        obj2 = MagicMock()
-        obj2.uuid = "uuid-2"
-        obj2.properties = {"title": "Second"}
-        obj2.metadata = MagicMock(score=0.5)
-
+        obj1 = _obj("uuid-1", {"title": "First"}, score=0.9)
+        obj2 = _obj("uuid-2", {"title": "Second"}, score=0.5)
         mock_collection = MagicMock()
-        mock_collection.query.hybrid.return_value = MagicMock(objects=[obj2, obj1])
+        mock_collection.query.hybrid.return_value = _FakeResponse([obj2, obj1])
         mock_weaviate_client["client"].collections.get.return_value = mock_collection
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert len(result["results"]) == 2
         assert result["results"][0]["score"] >= result["results"][1]["score"]
 
+    async def test_rerank_score_outranks_base_score(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN mixed reranked/unreranked hits WHEN limit=2 THEN top-2 by rerank_score, unreranked last."""
+        mock_weaviate_client["collection"].query.hybrid.return_value = _FakeResponse([
+            _obj("plain", {}, score=0.9),
+            _obj("low-rerank", {}, score=0.1, rerank_score=0.5),
+            _obj("high-rerank", {}, score=0.2, rerank_score=0.8),
+        ])
+
+        result = await knowledge_search(query="test", collections=["VideoAnalyses"], limit=2)
+        assert [r["object_id"] for r in result["results"]] == ["high-rerank", "low-rerank"]
+
     async def test_passes_filters_to_hybrid(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search passes filter object to hybrid() when filters provided."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(
             query="AI", collections=["ResearchFindings"], evidence_tier="CONFIRMED",
         )
@@ -84,11 +190,9 @@ class TestKnowledgeSearch:
         assert result["filters_applied"] == {"evidence_tier": "CONFIRMED"}
 
     async def test_filter_skipped_for_inapplicable_collection(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search skips evidence_tier filter for VideoAnalyses (no such property)."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         await knowledge_search(
             query="test", collections=["VideoAnalyses"], evidence_tier="CONFIRMED",
         )
@@ -97,11 +201,9 @@ class TestKnowledgeSearch:
         assert call_kwargs["filters"] is None
 
     async def test_source_tool_filter(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search applies source_tool filter to any collection."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(
             query="test", collections=["VideoAnalyses"], source_tool="video_analyze",
         )
@@ -109,35 +211,33 @@ class TestKnowledgeSearch:
         assert call_kwargs["filters"] is not None
         assert result["filters_applied"] == {"source_tool": "video_analyze"}
 
+    async def test_hybrid_uses_relative_score_fusion(
+        self, mock_weaviate_client, clean_config
+    ):
+        """knowledge_search requests relative-score fusion so scores compare across collections."""
+        await knowledge_search(query="test", collections=["VideoAnalyses"])
+        call_kwargs = mock_weaviate_client["collection"].query.hybrid.call_args[1]
+        assert call_kwargs["fusion_type"] == HybridFusion.RELATIVE_SCORE
+
     async def test_no_filters_applied_field_when_no_filters(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search returns filters_applied=None when no filters used."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test")
         assert result["filters_applied"] is None
 
     async def test_global_limit_truncates_merged_results(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """GIVEN 3 collections return 5 hits each WHEN limit=5 THEN only 5 total results returned."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-
-        def make_obj(uuid_str, score):
-            obj = MagicMock()
-            obj.uuid = uuid_str
-            obj.properties = {"title": f"Hit {uuid_str}"}
-            obj.metadata = MagicMock(score=score, rerank_score=None)
-            return obj
-
         # 5 objects per collection, 3 collections = 15 total raw results
-        objects_batch = [make_obj(f"uuid-{i}", 0.9 - i * 0.1) for i in range(5)]
+        objects_batch = [
+            _obj(f"uuid-{i}", {"title": f"Hit uuid-{i}"}, score=0.9 - i * 0.1) for i in range(5)
+        ]
         mock_collection = MagicMock()
-        mock_collection.query.hybrid.return_value = MagicMock(objects=objects_batch)
+        mock_collection.query.hybrid.return_value = _FakeResponse(objects_batch)
         mock_weaviate_client["client"].collections.get.return_value = mock_collection
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(
             query="test", collections=["VideoAnalyses", "VideoMetadata", "ResearchFindings"], limit=5
         )
@@ -146,36 +246,91 @@ class TestKnowledgeSearch:
         assert result["total_results"] == 5
         assert len(result["results"]) == 5
 
+    async def test_failed_collection_does_not_drop_others(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN one collection query raises WHEN knowledge_search THEN other collections' hits are kept."""
+        ok = MagicMock()
+        ok.query.hybrid.return_value = _FakeResponse([_obj("uuid-ok", {"title": "Ok"}, score=0.7)])
+        broken = MagicMock()
+        broken.query.hybrid.side_effect = RuntimeError("shard down")
+        mock_weaviate_client["client"].collections.get.side_effect = (
+            lambda name: broken if name == "ResearchFindings" else ok
+        )
+
+        result = await knowledge_search(
+            query="test", collections=["VideoAnalyses", "ResearchFindings"],
+        )
+
+        assert [(r["collection"], r["object_id"]) for r in result["results"]] == [
+            ("VideoAnalyses", "uuid-ok"),
+        ]
+
+    async def test_fan_out_respects_max_concurrency(
+        self, mock_weaviate_client, clean_config, monkeypatch
+    ):
+        """GIVEN WEAVIATE_MAX_CONCURRENCY=2 WHEN searching every collection THEN at most 2 queries overlap."""
+        monkeypatch.setenv("WEAVIATE_MAX_CONCURRENCY", "2")
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def _slow_hybrid(**_kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return _FakeResponse()
+
+        mock_weaviate_client["collection"].query.hybrid.side_effect = _slow_hybrid
+
+        await knowledge_search(query="test")
+
+        assert mock_weaviate_client["collection"].query.hybrid.call_count == len(ALL_COLLECTION_NAMES)
+        assert peak <= 2
+
+    async def test_waiting_queries_do_not_hold_worker_threads(
+        self, mock_weaviate_client, clean_config, monkeypatch
+    ):
+        """GIVEN WEAVIATE_MAX_CONCURRENCY=2 WHEN searching every collection THEN at most 2 threads are dispatched at once."""
+        monkeypatch.setenv("WEAVIATE_MAX_CONCURRENCY", "2")
+        real_to_thread = asyncio.to_thread
+        dispatched = peak = 0
+
+        async def _counting_to_thread(fn, *args, **kwargs):
+            nonlocal dispatched, peak
+            dispatched += 1
+            peak = max(peak, dispatched)
+            try:
+                return await real_to_thread(fn, *args, **kwargs)
+            finally:
+                dispatched -= 1
+
+        monkeypatch.setattr(asyncio, "to_thread", _counting_to_thread)
+        mock_weaviate_client["collection"].query.hybrid.return_value = _FakeResponse()
+
+        await knowledge_search(query="test")
+
+        assert mock_weaviate_client["collection"].query.hybrid.call_count == len(ALL_COLLECTION_NAMES)
+        assert peak <= 2
+
 
 class TestKnowledgeRelated:
     """Tests for knowledge_related tool."""
 
-    async def test_returns_empty_when_disabled(self, mock_weaviate_disabled):
-        """knowledge_related returns empty result when Weaviate not configured."""
-        from video_research_mcp.tools.knowledge import knowledge_related
-        result = await knowledge_related(object_id="test-uuid", collection="VideoAnalyses")
-        assert result["related"] == []
-
     async def test_excludes_self_from_results(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_related excludes the source object from results."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        self_obj = MagicMock()
-        self_obj.uuid = "source-uuid"
-        self_obj.properties = {"title": "Self"}
-        self_obj.metadata = MagicMock(distance=0.0)
-
-        other_obj = MagicMock()
-        other_obj.uuid = "other-uuid"
-        other_obj.properties = {"title": "Other"}
-        other_obj.metadata = MagicMock(distance=0.3)
+        self_obj = _obj("source-uuid", {"title": "Self"}, distance=0.0)
+        other_obj = _obj("other-uuid", {"title": "Other"}, distance=0.3)
 
         mock_collection = MagicMock()
-        mock_collection.query.near_object.return_value = MagicMock(objects=[self_obj, other_obj])
+        mock_collection.query.near_object.return_value = _FakeResponse([self_obj, other_obj])
         mock_weaviate_client["client"].collections.get.return_value = mock_collection
 
-        from video_research_mcp.tools.knowledge import knowledge_related
         result = await knowledge_related(object_id="source-uuid", collection="VideoAnalyses")
         assert len(result["related"]) == 1
         assert result["related"][0]["object_id"] == "other-uuid"
@@ -184,73 +339,44 @@ class TestKnowledgeRelated:
 class TestKnowledgeStats:
     """Tests for knowledge_stats tool."""
 
-    async def test_returns_empty_when_disabled(self, mock_weaviate_disabled):
-        """knowledge_stats returns empty when Weaviate not configured."""
-        from video_research_mcp.tools.knowledge import knowledge_stats
-        result = await knowledge_stats()
-        assert result["total_objects"] == 0
-
-    async def test_returns_stats_for_all_collections(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """knowledge_stats returns stats for all 7 collections."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agg = MagicMock(total_count=5)
-        mock_col = MagicMock()
-        mock_col.aggregate.over_all.return_value = mock_agg
-        mock_weaviate_client["client"].collections.get.return_value = mock_col
-
-        from video_research_mcp.tools.knowledge import knowledge_stats
-        result = await knowledge_stats()
-        assert len(result["collections"]) == 11
-        assert result["total_objects"] == 55
-
-    async def test_returns_stats_for_single_collection(
-        self, mock_weaviate_client, clean_config, monkeypatch
-    ):
-        """knowledge_stats returns stats for a single collection."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agg = MagicMock(total_count=10)
-        mock_col = MagicMock()
-        mock_col.aggregate.over_all.return_value = mock_agg
-        mock_weaviate_client["client"].collections.get.return_value = mock_col
+    @pytest.mark.parametrize(
+        ("kwargs", "count", "expected_names"),
+        [
+            pytest.param({}, 5, ALL_COLLECTION_NAMES, id="all-collections"),
+            pytest.param({"collection": "VideoAnalyses"}, 10, ["VideoAnalyses"], id="single"),
+            # VideoAnalyses has no evidence_tier property, so group_by is ignored
+            pytest.param(
+                {"collection": "VideoAnalyses", "group_by": "evidence_tier"}, 5, ["VideoAnalyses"],
+                id="group-by-inapplicable",
+            ),
+        ],
+    )
+    async def test_returns_stats(
+        self, mock_weaviate_client, clean_config, kwargs, count, expected_names
+    ):
+        """knowledge_stats returns one ungrouped entry per requested collection."""
+        mock_weaviate_client["collection"].aggregate.over_all.return_value = SimpleNamespace(
+            total_count=count,
+        )
 
-        from video_research_mcp.tools.knowledge import knowledge_stats
-        result = await knowledge_stats(collection="VideoAnalyses")
-        assert len(result["collections"]) == 1
-        assert result["collections"][0]["count"] == 10
+        result = await knowledge_stats(**kwargs)
+        assert [c["name"] for c in result["collections"]] == list(expected_names)
+        assert all(c["count"] == count and c["groups"] is None for c in result["collections"])
+        assert result["total_objects"] == count * len(expected_names)
 
     async def test_group_by_returns_groups(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_stats with group_by returns grouped counts."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agg = MagicMock(total_count=10)
-        mock_col = MagicMock()
-        mock_col.aggregate.over_all.return_value = mock_agg
-
-        # Mock grouped aggregation response
-        group1 = MagicMock()
-        group1.grouped_by = MagicMock(value="CONFIRMED")
-        group1.total_count = 7
-        group2 = MagicMock()
-        group2.grouped_by = MagicMock(value="INFERENCE")
-        group2.total_count = 3
-        mock_grouped_response = MagicMock()
-        mock_grouped_response.groups = [group1, group2]
-
-        # First call returns total count, second returns grouped
-        call_count = [0]
-        def over_all_side_effect(**kwargs):
-            call_count[0] += 1
-            if "group_by" in kwargs:
-                return mock_grouped_response
-            return mock_agg
-        mock_col.aggregate.over_all.side_effect = over_all_side_effect
-
-        mock_weaviate_client["client"].collections.get.return_value = mock_col
-
-        from video_research_mcp.tools.knowledge import knowledge_stats
+        # knowledge_stats aggregates the total first, then the grouped counts
+        mock_weaviate_client["collection"].aggregate.over_all.side_effect = [
+            SimpleNamespace(total_count=10),
+            SimpleNamespace(groups=[
+                _Group(_Grouped("CONFIRMED"), 7),
+                _Group(_Grouped("INFERENCE"), 3),
+            ]),
+        ]
+
         result = await knowledge_stats(collection="ResearchFindings", group_by="evidence_tier")
         assert len(result["collections"]) == 1
         stats = result["collections"][0]
@@ -258,37 +384,32 @@ class TestKnowledgeStats:
         assert stats["groups"]["CONFIRMED"] == 7
         assert stats["groups"]["INFERENCE"] == 3
 
-    async def test_group_by_skipped_for_inapplicable_property(
-        self, mock_weaviate_client, clean_config, monkeypatch
+    async def test_failed_collection_counts_zero(
+        self, mock_weaviate_client, clean_config
     ):
-        """knowledge_stats ignores group_by when property doesn't exist in collection."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_agg = MagicMock(total_count=5)
-        mock_col = MagicMock()
-        mock_col.aggregate.over_all.return_value = mock_agg
-        mock_weaviate_client["client"].collections.get.return_value = mock_col
+        """GIVEN one collection aggregate raises WHEN knowledge_stats THEN it counts 0, order kept."""
+        ok = MagicMock()
+        ok.aggregate.over_all.return_value = SimpleNamespace(total_count=4)
+        broken = MagicMock()
+        broken.aggregate.over_all.side_effect = RuntimeError("shard down")
+        mock_weaviate_client["client"].collections.get.side_effect = (
+            lambda name: broken if name == ALL_COLLECTION_NAMES[0] else ok
+        )
+
+        result = await knowledge_stats()
 
-        from video_research_mcp.tools.knowledge import knowledge_stats
-        # VideoAnalyses doesn't have evidence_tier
-        result = await knowledge_stats(collection="VideoAnalyses", group_by="evidence_tier")
-        assert result["collections"][0]["groups"] is None
+        assert [c["name"] for c in result["collections"]] == ALL_COLLECTION_NAMES
+        assert result["collections"][0]["count"] == 0
+        assert result["total_objects"] == 4 * (len(ALL_COLLECTION_NAMES) - 1)
 
 
 class TestKnowledgeIngest:
     """Tests for knowledge_ingest tool."""
 
-    async def test_returns_error_when_disabled(self, mock_weaviate_disabled):
-        """knowledge_ingest returns error when Weaviate not configured."""
-        from video_research_mcp.tools.knowledge import knowledge_ingest
-        result = await knowledge_ingest(collection="VideoAnalyses", properties={"title": "x"})
-        assert "error" in result
-
     async def test_returns_ingest_result(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_ingest returns KnowledgeIngestResult dict."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_ingest
         result = await knowledge_ingest(
             collection="VideoAnalyses",
             properties={"title": "Manual entry", "summary": "Test"},
@@ -297,11 +418,9 @@ class TestKnowledgeIngest:
         assert result["status"] == "success"
 
     async def test_rejects_unknown_properties(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_ingest rejects properties not in schema."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_ingest
         result = await knowledge_ingest(
             collection="VideoAnalyses",
             properties={"title": "ok", "totally_fake_field": "bad"},
@@ -309,13 +428,11 @@ class TestKnowledgeIngest:
         assert "error" in result
 
     async def test_handles_insert_error(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_ingest returns error dict on failure."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         mock_weaviate_client["collection"].data.insert.side_effect = RuntimeError("Insert failed")
 
-        from video_research_mcp.tools.knowledge import knowledge_ingest
         result = await knowledge_ingest(
             collection="VideoAnalyses",
             properties={"title": "Will fail"},
@@ -327,28 +444,21 @@ class TestSearchModes:
     """Tests for search_type parameter in knowledge_search."""
 
     async def test_default_uses_hybrid(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search defaults to hybrid search."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         await knowledge_search(query="test", collections=["VideoAnalyses"])
         mock_weaviate_client["collection"].query.hybrid.assert_called_once()
         mock_weaviate_client["collection"].query.near_text.assert_not_called()
         mock_weaviate_client["collection"].query.bm25.assert_not_called()
 
     async def test_semantic_uses_near_text(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """search_type="semantic" dispatches to near_text."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj = MagicMock()
-        obj.uuid = "uuid-1"
-        obj.properties = {"title": "Result"}
-        obj.metadata = MagicMock(distance=0.2)
-        mock_weaviate_client["collection"].query.near_text.return_value = MagicMock(objects=[obj])
-
-        from video_research_mcp.tools.knowledge import knowledge_search
+        obj = _obj("uuid-1", {"title": "Result"}, distance=0.2)
+        mock_weaviate_client["collection"].query.near_text.return_value = _FakeResponse([obj])
+
         result = await knowledge_search(
             query="test", collections=["VideoAnalyses"], search_type="semantic",
         )
@@ -358,17 +468,12 @@ class TestSearchModes:
         assert result["results"][0]["score"] == 0.8  # 1.0 - 0.2
 
     async def test_keyword_uses_bm25(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """search_type="keyword" dispatches to bm25."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj = MagicMock()
-        obj.uuid = "uuid-1"
-        obj.properties = {"query": "AI"}
-        obj.metadata = MagicMock(score=2.5)
-        mock_weaviate_client["collection"].query.bm25.return_value = MagicMock(objects=[obj])
-
-        from video_research_mcp.tools.knowledge import knowledge_search
+        obj = _obj("uuid-1", {"query": "AI"}, score=2.5)
+        mock_weaviate_client["collection"].query.bm25.return_value = _FakeResponse([obj])
+
         result = await knowledge_search(
             query="AI", collections=["WebSearchResults"], search_type="keyword",
         )
@@ -378,13 +483,11 @@ class TestSearchModes:
         assert result["results"][0]["score"] == 2.5
 
     async def test_semantic_passes_filters(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """Semantic search respects collection filters."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        mock_weaviate_client["collection"].query.near_text.return_value = MagicMock(objects=[])
+        mock_weaviate_client["collection"].query.near_text.return_value = _FakeResponse([])
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(
             query="AI", collections=["ResearchFindings"],
             search_type="semantic", evidence_tier="CONFIRMED",
@@ -397,48 +500,34 @@ class TestSearchModes:
 class TestKnowledgeFetch:
     """Tests for knowledge_fetch tool."""
 
-    async def test_returns_error_when_disabled(self, mock_weaviate_disabled):
-        """knowledge_fetch returns error when Weaviate not configured."""
-        from video_research_mcp.tools.knowledge import knowledge_fetch
-        result = await knowledge_fetch(object_id="test-uuid", collection="VideoAnalyses")
-        assert "error" in result
-
     async def test_returns_object_when_found(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_fetch returns properties when object exists."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj = MagicMock()
-        obj.uuid = "test-uuid-1234"
-        obj.properties = {"title": "My Video", "summary": "A summary"}
+        obj = _obj("test-uuid-1234", {"title": "My Video", "summary": "A summary"})
         mock_weaviate_client["collection"].query.fetch_object_by_id.return_value = obj
 
-        from video_research_mcp.tools.knowledge import knowledge_fetch
         result = await knowledge_fetch(object_id="test-uuid-1234", collection="VideoAnalyses")
         assert result["found"] is True
         assert result["collection"] == "VideoAnalyses"
         assert result["properties"]["title"] == "My Video"
 
     async def test_returns_not_found_for_missing_object(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_fetch returns found=False when UUID doesn't exist."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         mock_weaviate_client["collection"].query.fetch_object_by_id.return_value = None
 
-        from video_research_mcp.tools.knowledge import knowledge_fetch
         result = await knowledge_fetch(object_id="nonexistent", collection="VideoAnalyses")
         assert result["found"] is False
         assert result["properties"] == {}
 
     async def test_handles_fetch_error(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_fetch returns error dict on failure."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         mock_weaviate_client["collection"].query.fetch_object_by_id.side_effect = RuntimeError("fail")
 
-        from video_research_mcp.tools.knowledge import knowledge_fetch
         result = await knowledge_fetch(object_id="test-uuid", collection="VideoAnalyses")
         assert "error" in result
 
@@ -447,29 +536,23 @@ class TestMCPSerialization:
     """Tests for MCP JSON-RPC dict/list string coercion."""
 
     async def test_search_collections_from_json_string(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search parses collections from JSON string (MCP transport)."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         await knowledge_search(query="test", collections='["VideoAnalyses"]')
-        assert mock_weaviate_client["client"].collections.get.call_count == 1
+        assert _queried(mock_weaviate_client) == {"VideoAnalyses"}
 
     async def test_search_collections_none_unchanged(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search searches all collections when None passed."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         await knowledge_search(query="test", collections=None)
-        assert mock_weaviate_client["client"].collections.get.call_count == 11
+        assert _queried(mock_weaviate_client) == set(ALL_COLLECTION_NAMES)
 
     async def test_ingest_properties_from_json_string(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_ingest parses properties from JSON string (MCP transport)."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_ingest
         result = await knowledge_ingest(
             collection="VideoAnalyses",
             properties=json.dumps({"title": "Test", "summary": "A summary"}),
@@ -477,11 +560,9 @@ class TestMCPSerialization:
         assert result["status"] == "success"
 
     async def test_ingest_invalid_json_string(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_ingest treats invalid JSON string as raw string (fails validation)."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_ingest
         result = await knowledge_ingest(
             collection="VideoAnalyses",
             properties="not valid json",
@@ -494,11 +575,9 @@ class TestReranking:
     """Tests for Cohere reranking integration in knowledge_search."""
 
     async def test_reranked_flag_false_when_disabled(
-        self, mock_weaviate_client, clean_config, monkeypatch
+        self, mock_weaviate_client, clean_config
     ):
         """knowledge_search returns reranked=False when reranker is disabled."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert result["reranked"] is False
 
@@ -506,9 +585,7 @@ class TestReranking:
         self, mock_weaviate_client, clean_config, monkeypatch
     ):
         """knowledge_search returns reranked=True when reranker is enabled."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         monkeypatch.setenv("COHERE_API_KEY", "test-cohere-key")
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert result["reranked"] is True
 
@@ -516,9 +593,7 @@ class TestReranking:
         self, mock_weaviate_client, clean_config, monkeypatch
     ):
         """knowledge_search overfetches by 3x when reranking is enabled."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         monkeypatch.setenv("COHERE_API_KEY", "test-cohere-key")
-        from video_research_mcp.tools.knowledge import knowledge_search
         await knowledge_search(query="test", collections=["VideoAnalyses"], limit=5)
         call_kwargs = mock_weaviate_client["collection"].query.hybrid.call_args[1]
         assert call_kwargs["limit"] == 15  # 5 * 3
@@ -527,55 +602,39 @@ class TestReranking:
         self, mock_weaviate_client, clean_config, monkeypatch
     ):
         """knowledge_search extracts rerank_score from metadata."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         monkeypatch.setenv("COHERE_API_KEY", "test-cohere-key")
 
-        obj = MagicMock()
-        obj.uuid = "uuid-1"
-        obj.properties = {"title": "Test"}
-        obj.metadata = MagicMock(score=0.5, rerank_score=0.92)
-        mock_weaviate_client["collection"].query.hybrid.return_value = MagicMock(objects=[obj])
+        obj = _obj("uuid-1", {"title": "Test"}, score=0.5, rerank_score=0.92)
+        mock_weaviate_client["collection"].query.hybrid.return_value = _FakeResponse([obj])
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert result["results"][0]["rerank_score"] == 0.92
 
     async def test_flash_processed_reflects_actual_success(
-        self, mock_weaviate_client, clean_config, monkeypatch, mock_gemini_client
+        self, mock_weaviate_client, clean_config, mock_gemini_client
     ):
         """knowledge_search sets flash_processed based on whether summaries were generated."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj = MagicMock()
-        obj.uuid = "uuid-1"
-        obj.properties = {"title": "Test"}
-        obj.metadata = MagicMock(score=0.5, rerank_score=None)
-        mock_weaviate_client["collection"].query.hybrid.return_value = MagicMock(objects=[obj])
-
-        from video_research_mcp.models.knowledge import HitSummary, HitSummaryBatch
+        obj = _obj("uuid-1", {"title": "Test"}, score=0.5)
+        mock_weaviate_client["collection"].query.hybrid.return_value = _FakeResponse([obj])
+
         mock_gemini_client["generate_structured"].return_value = HitSummaryBatch(
             summaries=[HitSummary(
                 object_id="uuid-1", relevance=0.9, summary="Relevant", useful_properties=["title"],
             )],
         )
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert result["flash_processed"] is True
 
     async def test_flash_processed_false_on_silent_failure(
-        self, mock_weaviate_client, clean_config, monkeypatch, mock_gemini_client
+        self, mock_weaviate_client, clean_config, mock_gemini_client
     ):
         """knowledge_search sets flash_processed=False when Flash fails silently."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
-        obj = MagicMock()
-        obj.uuid = "uuid-1"
-        obj.properties = {"title": "Test"}
-        obj.metadata = MagicMock(score=0.5, rerank_score=None)
-        mock_weaviate_client["collection"].query.hybrid.return_value = MagicMock(objects=[obj])
+        obj = _obj("uuid-1", {"title": "Test"}, score=0.5)
+        mock_weaviate_client["collection"].query.hybrid.return_value = _FakeResponse([obj])
 
         mock_gemini_client["generate_structured"].side_effect = RuntimeError("Flash down")
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert result["flash_processed"] is False
 
@@ -583,14 +642,87 @@ class TestReranking:
         self, mock_weaviate_client, clean_config, monkeypatch
     ):
         """knowledge_search returns flash_processed=False when FLASH_SUMMARIZE=false."""
-        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
         monkeypatch.setenv("FLASH_SUMMARIZE", "false")
-        obj = MagicMock()
-        obj.uuid = "uuid-1"
-        obj.properties = {"title": "Test"}
-        obj.metadata = MagicMock(score=0.5, rerank_score=None)
-        mock_weaviate_client["collection"].query.hybrid.return_value = MagicMock(objects=[obj])
+        obj = _obj("uuid-1", {"title": "Test"}, score=0.5)
+        mock_weaviate_client["collection"].query.hybrid.return_value = _FakeResponse([obj])
 
-        from video_research_mcp.tools.knowledge import knowledge_search
         result = await knowledge_search(query="test", collections=["VideoAnalyses"])
         assert result["flash_processed"] is False
+
+
+class TestSearchResultCache:
+    """Tests for knowledge_search's short-lived in-memory result cache."""
+
+    async def test_repeated_search_served_from_cache(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN an identical repeated search WHEN within the TTL THEN Weaviate is queried once."""
+        first = await knowledge_search(query="rag", collections=["VideoAnalyses"])
+        second = await knowledge_search(query="rag", collections=["VideoAnalyses"])
+
+        assert second == first
+        assert mock_weaviate_client["client"].collections.get.call_count == 1
+
+    async def test_different_params_miss_cache(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN searches differing only in limit WHEN run THEN each queries Weaviate."""
+        await knowledge_search(query="rag", collections=["VideoAnalyses"], limit=5)
+        await knowledge_search(query="rag", collections=["VideoAnalyses"], limit=6)
+
+        assert mock_weaviate_client["client"].collections.get.call_count == 2
+
+    async def test_ingest_invalidates_cache(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN a cached search WHEN knowledge_ingest succeeds THEN the next search re-queries."""
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+        await knowledge_ingest(collection="VideoAnalyses", properties={"title": "New"})
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+
+        # search, ingest, search
+        assert mock_weaviate_client["client"].collections.get.call_count == 3
+
+    async def test_write_during_search_not_cached(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN a search in flight WHEN a store write finishes first THEN its result is not cached."""
+        started, release = threading.Event(), threading.Event()
+
+        def _slow_hybrid(**kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return _FakeResponse()
+
+        hybrid = mock_weaviate_client["collection"].query.hybrid
+        hybrid.side_effect = _slow_hybrid
+        search = asyncio.create_task(knowledge_search(query="rag", collections=["VideoAnalyses"]))
+        await asyncio.to_thread(started.wait, 5)
+        await store_content_analysis({"title": "New"}, "https://example.com", "summarize")
+        release.set()
+        await search
+
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+
+        assert hybrid.call_count == 2
+
+    async def test_flash_model_switch_misses_cache(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN a cached search WHEN infra_configure switches the Flash model THEN the search re-queries."""
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+        update_config(flash_model="gemini-other-flash")
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+
+        assert mock_weaviate_client["client"].collections.get.call_count == 2
+
+    async def test_partial_failure_not_cached(
+        self, mock_weaviate_client, clean_config
+    ):
+        """GIVEN a collection query fails WHEN the search is repeated THEN it is retried."""
+        mock_weaviate_client["collection"].query.hybrid.side_effect = RuntimeError("shard down")
+
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+        await knowledge_search(query="rag", collections=["VideoAnalyses"])
+
+        assert mock_weaviate_client["collection"].query.hybrid.call_count == 2
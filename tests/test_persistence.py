@@ -37,6 +37,22 @@ def db(db_path):
     d.close()
 
 
+# datetimes are immutable, so every session can share the same timestamps
+_CREATED_AT = datetime(2025, 1, 1, 12, 0, 0)
+_LAST_ACTIVE = datetime(2025, 1, 1, 12, 30, 0)
+
+# Canonical Content fixtures, built once; tests only read them
+_SAMPLE_HISTORY = (
+    types.Content(role="user", parts=[types.Part(text="Hello")]),
+    types.Content(role="model", parts=[types.Part(text="Hi there")]),
+)
+_TEXT_CONTENT = types.Content(role="user", parts=[types.Part(text="test")])
+_FILE_CONTENT = types.Content(
+    role="user",
+    parts=[types.Part(file_data=types.FileData(file_uri="gs://bucket/file"))],
+)
+
+
 def _make_session(
     sid="abc123",
     url="https://youtube.com/watch?v=test",
@@ -49,8 +65,8 @@ def _make_session(
         mode="general",
         video_title="Test Video",
         history=history or [],
-        created_at=datetime(2025, 1, 1, 12, 0, 0),
-        last_active=datetime(2025, 1, 1, 12, 30, 0),
+        created_at=_CREATED_AT,
+        last_active=_LAST_ACTIVE,
         turn_count=turn_count,
     )
 
@@ -66,6 +82,8 @@ class TestSessionDB:
         assert loaded.url == "https://youtube.com/watch?v=test"
         assert loaded.video_title == "Test Video"
         assert loaded.turn_count == 0
+        assert loaded.created_at == _CREATED_AT
+        assert loaded.last_active == _LAST_ACTIVE
 
     def test_load_missing_returns_none(self, db):
         """GIVEN no session stored WHEN loading THEN returns None."""
@@ -82,11 +100,7 @@ class TestSessionDB:
 
     def test_history_serialization(self, db):
         """GIVEN a session with history WHEN roundtripped THEN history preserved."""
-        history = [
-            types.Content(role="user", parts=[types.Part(text="Hello")]),
-            types.Content(role="model", parts=[types.Part(text="Hi there")]),
-        ]
-        session = _make_session(history=history, turn_count=1)
+        session = _make_session(history=list(_SAMPLE_HISTORY), turn_count=1)
         db.save_sync(session)
         loaded = db.load_sync("abc123")
         assert len(loaded.history) == 2
@@ -123,25 +137,12 @@ class TestSessionDB:
 
 class TestContentSerialization:
     def test_text_content_roundtrip(self):
-        content = types.Content(
-            role="user", parts=[types.Part(text="test")]
-        )
-        d = _content_to_dict(content)
+        d = _content_to_dict(_TEXT_CONTENT)
         result = _dict_to_content(d)
         assert result.role == "user"
         assert result.parts[0].text == "test"
 
     def test_file_data_roundtrip(self):
-        content = types.Content(
-            role="user",
-            parts=[
-                types.Part(
-                    file_data=types.FileData(
-                        file_uri="gs://bucket/file"
-                    )
-                )
-            ],
-        )
-        d = _content_to_dict(content)
+        d = _content_to_dict(_FILE_CONTENT)
         result = _dict_to_content(d)
         assert result.parts[0].file_data.file_uri == "gs://bucket/file"
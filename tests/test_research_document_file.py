@@ -2,93 +2,172 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import httpx
+import pytest
 
+from video_research_mcp.tools import research_document_file
 from video_research_mcp.tools.research_document_file import (
     _normalize_document_url,
     _download_document,
+    _prepare_all_documents,
 )
 
 
 class TestNormalizeDocumentUrl:
     """Tests for _normalize_document_url."""
 
-    def test_arxiv_abs_to_pdf(self):
-        """GIVEN arxiv.org/abs URL WHEN normalized THEN converts to /pdf/.pdf."""
-        result = _normalize_document_url("https://arxiv.org/abs/2401.12345")
-        assert result == "https://arxiv.org/pdf/2401.12345.pdf"
-
-    def test_arxiv_abs_with_version(self):
-        """GIVEN arxiv.org/abs URL with version WHEN normalized THEN preserves version."""
-        result = _normalize_document_url("https://arxiv.org/abs/2401.12345v2")
-        assert result == "https://arxiv.org/pdf/2401.12345v2.pdf"
-
-    def test_arxiv_pdf_without_extension(self):
-        """GIVEN arxiv.org/pdf URL without .pdf WHEN normalized THEN adds .pdf."""
-        result = _normalize_document_url("https://arxiv.org/pdf/2401.12345")
-        assert result == "https://arxiv.org/pdf/2401.12345.pdf"
-
-    def test_arxiv_pdf_with_version_no_extension(self):
-        """GIVEN arxiv.org/pdf/XXXX.XXXXXv1 WHEN normalized THEN adds .pdf."""
-        result = _normalize_document_url("https://arxiv.org/pdf/2401.12345v1")
-        assert result == "https://arxiv.org/pdf/2401.12345v1.pdf"
-
-    def test_non_arxiv_url_unchanged(self):
-        """GIVEN non-arXiv URL WHEN normalized THEN returned unchanged."""
-        url = "https://example.com/paper.pdf"
-        assert _normalize_document_url(url) == url
-
-    def test_http_arxiv_also_normalized(self):
-        """GIVEN http:// arXiv URL WHEN normalized THEN still converts."""
-        result = _normalize_document_url("http://arxiv.org/abs/2401.12345")
-        assert result == "https://arxiv.org/pdf/2401.12345.pdf"
-
-    def test_arxiv_abs_trailing_slash(self):
-        """GIVEN arXiv URL with trailing slash WHEN normalized THEN still converts."""
-        result = _normalize_document_url("https://arxiv.org/abs/2401.12345/")
-        assert result == "https://arxiv.org/pdf/2401.12345.pdf"
-
-    def test_arxiv_abs_with_query_params(self):
-        """GIVEN arXiv URL with query params WHEN normalized THEN still converts."""
-        result = _normalize_document_url("https://arxiv.org/abs/2401.12345?context=stat")
-        assert result == "https://arxiv.org/pdf/2401.12345.pdf"
-
-    def test_arxiv_abs_trailing_slash_and_query(self):
-        """GIVEN arXiv URL with trailing slash AND query WHEN normalized THEN converts."""
-        result = _normalize_document_url("https://arxiv.org/abs/2401.12345v2/?utm=1")
-        assert result == "https://arxiv.org/pdf/2401.12345v2.pdf"
-
-    def test_arxiv_pdf_trailing_slash(self):
-        """GIVEN arXiv /pdf/ URL with trailing slash WHEN normalized THEN adds .pdf."""
-        result = _normalize_document_url("https://arxiv.org/pdf/2401.12345/")
-        assert result == "https://arxiv.org/pdf/2401.12345.pdf"
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="abs-to-pdf",
+            ),
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345v2",
+                "https://arxiv.org/pdf/2401.12345v2.pdf",
+                id="abs-with-version",
+            ),
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="pdf-without-extension",
+            ),
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345v1",
+                "https://arxiv.org/pdf/2401.12345v1.pdf",
+                id="pdf-with-version-no-extension",
+            ),
+            pytest.param(
+                "http://arxiv.org/abs/2401.12345",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="http-scheme",
+            ),
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345/",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="abs-trailing-slash",
+            ),
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345?context=stat",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="abs-query-params",
+            ),
+            pytest.param(
+                "https://arxiv.org/abs/2401.12345v2/?utm=1",
+                "https://arxiv.org/pdf/2401.12345v2.pdf",
+                id="abs-trailing-slash-and-query",
+            ),
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345/",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="pdf-trailing-slash",
+            ),
+            pytest.param(
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                "https://arxiv.org/pdf/2401.12345.pdf",
+                id="pdf-with-extension-unchanged",
+            ),
+            pytest.param(
+                "https://example.com/paper.pdf",
+                "https://example.com/paper.pdf",
+                id="non-arxiv-unchanged",
+            ),
+        ],
+    )
+    def test_normalizes(self, url, expected):
+        """GIVEN a document URL WHEN normalized THEN arXiv pages map to the canonical .pdf URL."""
+        assert _normalize_document_url(url) == expected
+
+
+@pytest.fixture()
+def download_calls(monkeypatch) -> list[dict]:
+    """Replace download_checked with a recording stub; returns its call log."""
+    calls: list[dict] = []
+
+    async def _download_checked(url, dest, *, max_bytes=None, client=None):
+        calls.append({"url": url, "dest": dest, "max_bytes": max_bytes, "client": client})
+        return dest / "stub.pdf"
+
+    monkeypatch.setattr(research_document_file, "download_checked", _download_checked)
+    return calls
 
 
 class TestDownloadDocument:
     """Tests for _download_document delegation to download_checked."""
 
-    async def test_normalizes_arxiv_url_before_download(self, tmp_path, clean_config):
+    async def test_normalizes_arxiv_url_before_download(self, tmp_path, clean_config, download_calls):
         """GIVEN arXiv /abs/ URL WHEN _download_document THEN passes normalized URL to download_checked."""
-        with patch("video_research_mcp.tools.research_document_file.download_checked", new_callable=AsyncMock) as mock_dl:
-            mock_dl.return_value = tmp_path / "2401.12345.pdf"
-            await _download_document("https://arxiv.org/abs/2401.12345", tmp_path)
+        await _download_document("https://arxiv.org/abs/2401.12345", tmp_path)
 
-            called_url = mock_dl.call_args[0][0]
-            assert called_url == "https://arxiv.org/pdf/2401.12345.pdf"
+        assert download_calls[0]["url"] == "https://arxiv.org/pdf/2401.12345.pdf"
 
-    async def test_passes_non_arxiv_url_unchanged(self, tmp_path, clean_config):
+    async def test_passes_non_arxiv_url_unchanged(self, tmp_path, clean_config, download_calls):
         """GIVEN regular URL WHEN _download_document THEN passes URL unchanged."""
-        with patch("video_research_mcp.tools.research_document_file.download_checked", new_callable=AsyncMock) as mock_dl:
-            mock_dl.return_value = tmp_path / "report.pdf"
-            await _download_document("https://example.com/report.pdf", tmp_path)
+        await _download_document("https://example.com/report.pdf", tmp_path)
 
-            called_url = mock_dl.call_args[0][0]
-            assert called_url == "https://example.com/report.pdf"
+        assert download_calls[0]["url"] == "https://example.com/report.pdf"
 
-    async def test_passes_max_bytes_from_config(self, tmp_path, clean_config):
+    async def test_passes_max_bytes_from_config(self, tmp_path, clean_config, download_calls):
         """download_checked receives max_bytes from config (default 50MB)."""
-        with patch("video_research_mcp.tools.research_document_file.download_checked", new_callable=AsyncMock) as mock_dl:
-            mock_dl.return_value = tmp_path / "doc.pdf"
-            await _download_document("https://example.com/doc.pdf", tmp_path)
+        await _download_document("https://example.com/doc.pdf", tmp_path)
 
-            assert mock_dl.call_args[1]["max_bytes"] == 50 * 1024 * 1024
+        assert download_calls[0]["max_bytes"] == 50 * 1024 * 1024
+
+
+@pytest.fixture()
+def batch_clients(monkeypatch, tmp_path) -> list[httpx.AsyncClient]:
+    """Record every download_client() created; uploads and temp dirs are stubbed out."""
+    clients: list[httpx.AsyncClient] = []
+
+    def _download_client():
+        client = httpx.AsyncClient()
+        clients.append(client)
+        return client
+
+    async def _prepare_document(path):
+        return f"files/{path.name}", path.name
+
+    monkeypatch.setattr(research_document_file, "download_client", _download_client)
+    monkeypatch.setattr(research_document_file, "_prepare_document", _prepare_document)
+    monkeypatch.setattr(research_document_file.tempfile, "mkdtemp", lambda prefix: str(tmp_path))
+    return clients
+
+
+class TestPrepareAllDocuments:
+    """Tests for _prepare_all_documents sharing one download client across URLs."""
+
+    async def test_urls_share_one_client(self, clean_config, download_calls, batch_clients):
+        """GIVEN several URLs WHEN preparing documents THEN one client serves every download, then closes."""
+        urls = ["https://example.com/a.pdf", "https://example.com/b.pdf", "https://example.org/c.pdf"]
+
+        prepared = await _prepare_all_documents(None, urls)
+
+        assert len(prepared) == len(urls)
+        assert len(batch_clients) == 1
+        assert [c["client"] for c in download_calls] == batch_clients * len(urls)
+        assert batch_clients[0].is_closed
+
+    async def test_client_closed_when_a_download_fails(
+        self, clean_config, monkeypatch, batch_clients
+    ):
+        """GIVEN one URL fails to download WHEN preparing THEN the others succeed and the client is closed."""
+        seen: list[httpx.AsyncClient | None] = []
+
+        async def _download_checked(url, dest, *, max_bytes=None, client=None):
+            seen.append(client)
+            if "broken" in url:
+                raise httpx.ConnectError("refused")
+            return dest / url.rsplit("/", 1)[-1]
+
+        monkeypatch.setattr(research_document_file, "download_checked", _download_checked)
+
+        prepared = await _prepare_all_documents(
+            None, ["https://example.com/ok.pdf", "https://broken.example.com/x.pdf"],
+        )
+
+        assert [original for _, _, original in prepared] == ["https://example.com/ok.pdf"]
+        assert len(batch_clients) == 1
+        assert seen == batch_clients * 2
+        assert batch_clients[0].is_closed
@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from google.genai import types
 
+from video_research_mcp.config import BATCH_CONCURRENCY
 from video_research_mcp.models.research_document import (
     CrossReferenceMap,
     DocumentFinding,
     DocumentFindingsContainer,
     DocumentMap,
     DocumentResearchReport,
+    DocumentSource,
 )
-from video_research_mcp.tools.research_document import research_document
+from video_research_mcp.tools.research_document import (
+    _phase_document_map,
+    research_document,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_store_fn():
+    """Keep research_document from writing findings to Weaviate."""
+    with patch(
+        "video_research_mcp.tools.research_document.store_research_finding",
+        new_callable=AsyncMock,
+    ) as mock:
+        yield mock
 
 
 @pytest.fixture()
@@ -54,12 +71,8 @@ def mock_store():
 
 
 class TestResearchDocument:
-    @patch(
-        "video_research_mcp.tools.research_document.store_research_finding",
-        new_callable=AsyncMock,
-    )
     async def test_single_document_moderate(
-        self, mock_store_fn, mock_prepare, mock_gemini_client,
+        self, mock_prepare, mock_gemini_client,
     ):
         """GIVEN one document WHEN moderate scope THEN phases 1-2-4 run."""
         mock_gemini_client["generate_structured"].side_effect = [
@@ -86,12 +99,8 @@ class TestResearchDocument:
         assert result["executive_summary"] == "The paper shows X."
         assert len(result["document_sources"]) == 1
 
-    @patch(
-        "video_research_mcp.tools.research_document.store_research_finding",
-        new_callable=AsyncMock,
-    )
     async def test_multi_document_deep(
-        self, mock_store_fn, mock_prepare_multi, mock_gemini_client,
+        self, mock_prepare_multi, mock_gemini_client,
     ):
         """GIVEN two documents WHEN deep scope THEN all 4 phases run."""
         mock_gemini_client["generate_structured"].side_effect = [
@@ -123,12 +132,8 @@ class TestResearchDocument:
         assert len(result["document_sources"]) == 2
         assert result["scope"] == "deep"
 
-    @patch(
-        "video_research_mcp.tools.research_document.store_research_finding",
-        new_callable=AsyncMock,
-    )
     async def test_quick_scope(
-        self, mock_store_fn, mock_prepare, mock_gemini_client,
+        self, mock_prepare, mock_gemini_client,
     ):
         """GIVEN quick scope WHEN running THEN only phases 1 and quick synthesis."""
         mock_gemini_client["generate_structured"].side_effect = [
@@ -163,12 +168,8 @@ class TestResearchDocument:
             )
             assert "error" in result
 
-    @patch(
-        "video_research_mcp.tools.research_document.store_research_finding",
-        new_callable=AsyncMock,
-    )
     async def test_gemini_failure_in_phase(
-        self, mock_store_fn, mock_prepare, mock_gemini_client,
+        self, mock_prepare, mock_gemini_client,
     ):
         """GIVEN Gemini fails during a phase WHEN running THEN error returned."""
         mock_gemini_client["generate_structured"].side_effect = RuntimeError("Gemini error")
@@ -178,10 +179,6 @@ class TestResearchDocument:
         )
         assert "error" in result
 
-    @patch(
-        "video_research_mcp.tools.research_document.store_research_finding",
-        new_callable=AsyncMock,
-    )
     async def test_weaviate_store_called(
         self, mock_store_fn, mock_prepare, mock_gemini_client,
     ):
@@ -198,12 +195,8 @@ class TestResearchDocument:
         )
         mock_store_fn.assert_called_once()
 
-    @patch(
-        "video_research_mcp.tools.research_document.store_research_finding",
-        new_callable=AsyncMock,
-    )
     async def test_url_source_type(
-        self, mock_store_fn, mock_gemini_client,
+        self, mock_gemini_client,
     ):
         """GIVEN a URL source WHEN processing THEN source_type is 'url'."""
         with patch(
@@ -222,3 +215,32 @@ class TestResearchDocument:
                 scope="moderate",
             )
             assert result["document_sources"][0]["source_type"] == "url"
+
+
+class TestPhaseConcurrency:
+    """Per-document phases run in parallel but stay under the concurrency cap."""
+
+    async def test_document_map_caps_parallel_calls(self, mock_gemini_client):
+        """GIVEN more documents than the cap WHEN phase 1 runs THEN in-flight calls never exceed it."""
+        in_flight = peak = 0
+
+        async def _slow_map(*_args, **_kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return DocumentMap(title="Doc", summary="Doc")
+
+        mock_gemini_client["generate_structured"].side_effect = _slow_map
+        count = BATCH_CONCURRENCY + 2
+        sources = [
+            DocumentSource(filename=f"doc{i}.pdf", original_path=f"/path/to/doc{i}.pdf")
+            for i in range(count)
+        ]
+        parts = [types.Part(text=f"doc {i}") for i in range(count)]
+
+        maps = await _phase_document_map(parts, sources, "test", "low")
+
+        assert [m.source_filename for m in maps] == [s.filename for s in sources]
+        assert peak == BATCH_CONCURRENCY
@@ -244,6 +244,23 @@ class TestDownloadChecked:
             )
             mock_cls.assert_called_once_with(follow_redirects=True, max_redirects=5, timeout=60)
 
+    async def test_uses_supplied_client(self, tmp_path: Path):
+        """GIVEN a caller-owned client WHEN download_checked runs THEN no new client is created."""
+        resp = _FakeResponse([b"content"])
+        client = _FakeClient(resp)
+        mock_cls = MagicMock()
+
+        with (
+            patch("video_research_mcp.url_policy.validate_url", new_callable=AsyncMock),
+            patch("video_research_mcp.url_policy.httpx.AsyncClient", mock_cls),
+        ):
+            result = await download_checked(
+                "https://example.com/doc.pdf", tmp_path, max_bytes=10_000, client=client,
+            )
+
+        mock_cls.assert_not_called()
+        assert result.read_bytes() == b"content"
+
     async def test_redirect_validates_final_url(self, tmp_path: Path):
         """GIVEN a URL that redirects to a different host,
         WHEN download_checked runs,
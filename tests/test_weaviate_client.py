@@ -50,6 +50,20 @@ class TestWeaviateClientGet:
         assert first is second
         assert mock_connect.call_count == 1
 
+    @patch("video_research_mcp.weaviate_client.weaviate.connect_to_weaviate_cloud")
+    def test_connected_client_skips_lock(self, mock_connect, clean_config, monkeypatch):
+        """get() returns a connected, schema-ensured client without taking the lock."""
+        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
+        import video_research_mcp.weaviate_client as wc_mod
+        wc_mod.WeaviateClient.reset()
+        mock_connect.return_value.collections.list_all.return_value = {}
+        first = wc_mod.WeaviateClient.get()
+
+        spy_lock = MagicMock()
+        monkeypatch.setattr(wc_mod, "_lock", spy_lock)
+        assert wc_mod.WeaviateClient.get() is first
+        spy_lock.__enter__.assert_not_called()
+
 
 class TestWeaviateClientClose:
     """Tests for close() and reset()."""
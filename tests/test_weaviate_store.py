@@ -292,6 +292,22 @@ class TestStoreWhenEnabled:
         assert result is not None
         mock_weaviate_client["collection"].data.insert.assert_called_once()
 
+    async def test_store_invalidates_cached_search(self, mock_weaviate_client, clean_config, monkeypatch):
+        """GIVEN a cached knowledge_search WHEN a store function writes THEN the next search re-queries."""
+        monkeypatch.setenv("WEAVIATE_URL", "https://test.weaviate.network")
+        from video_research_mcp.tools.knowledge import knowledge_search
+        from video_research_mcp.weaviate_store import store_content_analysis
+        mock_weaviate_client["collection"].query.hybrid.return_value = MagicMock(objects=[])
+        hybrid = mock_weaviate_client["collection"].query.hybrid
+
+        await knowledge_search(query="q", collections=["ContentAnalyses"])
+        await knowledge_search(query="q", collections=["ContentAnalyses"])
+        assert hybrid.call_count == 1
+
+        await store_content_analysis({"title": "New"}, "http://example.com", "summarize")
+        await knowledge_search(query="q", collections=["ContentAnalyses"])
+        assert hybrid.call_count == 2
+
 
 class TestStoreErrorHandling:
     """Test that store functions handle errors gracefully."""